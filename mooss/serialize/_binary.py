@@ -0,0 +1,573 @@
+# Imports
+import hashlib
+import struct
+from typing import Union, get_origin, get_args, Any, Callable, Optional
+
+from .interface import ISerializable
+
+
+# Constants
+BINARY_MAGIC = b"MSB\x01"
+"""
+Magic bytes placed at the start of every binary payload, the last byte is the version of the format.
+"""
+
+FINGERPRINT_SIZE = 8
+"""
+Size in bytes of the schema fingerprint written after the magic bytes.
+"""
+
+_STRUCT_BOOL = struct.Struct("<?")
+_STRUCT_INT = struct.Struct("<q")
+_STRUCT_FLOAT = struct.Struct("<d")
+_STRUCT_LENGTH = struct.Struct("<I")
+_STRUCT_TAG = struct.Struct("<B")
+
+_DYNAMIC_TAG_NONE = 0
+_DYNAMIC_TAG_BOOL = 1
+_DYNAMIC_TAG_INT = 2
+_DYNAMIC_TAG_FLOAT = 3
+_DYNAMIC_TAG_STR = 4
+_DYNAMIC_TAG_LIST = 5
+_DYNAMIC_TAG_DICT = 6
+_DYNAMIC_TAG_TUPLE = 7
+_DYNAMIC_TAG_SET = 8
+
+
+# Type aliases
+Encoder = Callable[[Any, bytearray], None]
+"""
+Function that appends the binary representation of a value to the given buffer.
+"""
+
+Decoder = Callable[[memoryview, int], tuple[Any, int]]
+"""
+Function that reads a value from the given buffer at the given offset and returns it alongside the new offset.
+"""
+
+
+# Classes
+class _ClassPlan:
+    """
+    Precomputed field order and codecs used to encode and decode a given 'ISerializable' class.
+    
+    Classes that are part of a polymorphic hierarchy are prefixed by the tag of their concrete class, which is then
+    used to pick the plan of the relevant subclass when decoding them.
+    
+    Should not be used outside this module !
+    """
+    
+    def __init__(self, serializable_class: type):
+        self.serializable_class = serializable_class
+        self.is_polymorphic = serializable_class._discriminator_registry is not None
+        self.field_names: list[str] = list()
+        self.encoders: list[Encoder] = list()
+        self.decoders: list[Decoder] = list()
+        self.fingerprint: bytes = b""
+    
+    def encode(self, value, buffer: bytearray):
+        value_class = type(value)
+        
+        if value_class is self.serializable_class:
+            if self.is_polymorphic:
+                _encode_dynamic(value_class._discriminator_tag, buffer)
+            self.encode_fields(value, buffer)
+            return
+        
+        # Subclasses are refused unless their tag can be encoded since only the fields of the expected class would
+        #  be encoded otherwise.
+        if not self.is_polymorphic or not isinstance(value, self.serializable_class) or \
+                value_class._discriminator_tag is None:
+            raise TypeError("The '{}' type cannot be encoded as '{}' !".format(
+                value_class, self.serializable_class.__name__))
+        
+        _encode_dynamic(value_class._discriminator_tag, buffer)
+        get_class_plan(value_class).encode_fields(value, buffer)
+    
+    def encode_fields(self, value, buffer: bytearray):
+        for field_name, encoder in zip(self.field_names, self.encoders):
+            encoder(getattr(value, field_name), buffer)
+    
+    def decode(self, buffer: memoryview, offset: int):
+        if not self.is_polymorphic:
+            return self.decode_fields(buffer, offset)
+        
+        tag, offset = _decode_dynamic(buffer, offset)
+        
+        if tag is None:
+            return self.decode_fields(buffer, offset)
+        
+        try:
+            tagged_class = self.serializable_class._get_tagged_class(tag)
+        except TypeError as err:
+            raise ValueError(str(err)) from err
+        
+        return get_class_plan(tagged_class).decode_fields(buffer, offset)
+    
+    def decode_fields(self, buffer: memoryview, offset: int):
+        kwargs: dict[str, Any] = dict()
+        
+        for field_name, decoder in zip(self.field_names, self.decoders):
+            kwargs[field_name], offset = decoder(buffer, offset)
+        
+        return self.serializable_class(**kwargs), offset
+
+
+# Globals
+_class_plans: dict[type, _ClassPlan] = dict()
+"""
+Cache of every '_ClassPlan' computed so far, indexed by their class.
+"""
+
+
+# Functions
+def _read_length(buffer: memoryview, offset: int) -> tuple[int, int]:
+    return _STRUCT_LENGTH.unpack_from(buffer, offset)[0], offset + _STRUCT_LENGTH.size
+
+
+def _write_length(length: int, buffer: bytearray):
+    buffer += _STRUCT_LENGTH.pack(length)
+
+
+def _check_remaining(buffer: memoryview, offset: int, size: int):
+    """
+    Checks if a given amount of bytes is left after the given offset since slicing past the end of the buffer
+    silently returns fewer bytes.
+    
+    :raises ValueError: If the buffer is too short.
+    """
+    
+    if offset + size > len(buffer):
+        raise ValueError("The given data is truncated or malformed !")
+
+
+def _make_primitive_codec(primitive_type: type, packer: struct.Struct) -> tuple[Encoder, Decoder]:
+    def encode(value, buffer: bytearray):
+        if type(value) is not primitive_type:
+            raise TypeError("The '{}' type cannot be encoded as '{}' !".format(type(value), primitive_type.__name__))
+        try:
+            buffer += packer.pack(value)
+        except struct.error as err:
+            raise ValueError("The value '{}' cannot be packed as '{}' !".format(value, primitive_type.__name__)) \
+                from err
+    
+    def decode(buffer: memoryview, offset: int):
+        return packer.unpack_from(buffer, offset)[0], offset + packer.size
+    
+    return encode, decode
+
+
+def _encode_str(value, buffer: bytearray):
+    if type(value) is not str:
+        raise TypeError("The '{}' type cannot be encoded as 'str' !".format(type(value)))
+    
+    encoded_value = value.encode("utf-8")
+    _write_length(len(encoded_value), buffer)
+    buffer += encoded_value
+
+
+def _decode_str(buffer: memoryview, offset: int):
+    length, offset = _read_length(buffer, offset)
+    _check_remaining(buffer, offset, length)
+    return str(buffer[offset:offset + length], "utf-8"), offset + length
+
+
+def _encode_none(value, buffer: bytearray):
+    if value is not None:
+        raise TypeError("The '{}' type cannot be encoded as 'None' !".format(type(value)))
+
+
+def _decode_none(buffer: memoryview, offset: int):
+    return None, offset
+
+
+_encode_bool, _decode_bool = _make_primitive_codec(bool, _STRUCT_BOOL)
+_encode_int, _decode_int = _make_primitive_codec(int, _STRUCT_INT)
+_encode_float, _decode_float = _make_primitive_codec(float, _STRUCT_FLOAT)
+
+
+def _encode_dynamic(value, buffer: bytearray):
+    """
+    Encodes a value whose type isn't known ahead of time by prefixing it with a tag byte.
+    Used for 'Any' and for non-composed 'list', 'dict', 'tuple' and 'set' types.
+    """
+    
+    value_type = type(value)
+    
+    if value is None:
+        buffer += _STRUCT_TAG.pack(_DYNAMIC_TAG_NONE)
+    elif value_type is bool:
+        buffer += _STRUCT_TAG.pack(_DYNAMIC_TAG_BOOL)
+        _encode_bool(value, buffer)
+    elif value_type is int:
+        buffer += _STRUCT_TAG.pack(_DYNAMIC_TAG_INT)
+        _encode_int(value, buffer)
+    elif value_type is float:
+        buffer += _STRUCT_TAG.pack(_DYNAMIC_TAG_FLOAT)
+        _encode_float(value, buffer)
+    elif value_type is str:
+        buffer += _STRUCT_TAG.pack(_DYNAMIC_TAG_STR)
+        _encode_str(value, buffer)
+    elif value_type in [list, tuple, set]:
+        buffer += _STRUCT_TAG.pack({
+            list: _DYNAMIC_TAG_LIST, tuple: _DYNAMIC_TAG_TUPLE, set: _DYNAMIC_TAG_SET
+        }[value_type])
+        _write_length(len(value), buffer)
+        for element in value:
+            _encode_dynamic(element, buffer)
+    elif value_type is dict:
+        buffer += _STRUCT_TAG.pack(_DYNAMIC_TAG_DICT)
+        _write_length(len(value), buffer)
+        for element_key, element_value in value.items():
+            _encode_dynamic(element_key, buffer)
+            _encode_dynamic(element_value, buffer)
+    else:
+        raise TypeError("The '{}' type cannot be encoded without a type annotation !".format(value_type))
+
+
+def _decode_dynamic(buffer: memoryview, offset: int):
+    tag = buffer[offset]
+    offset += _STRUCT_TAG.size
+    
+    if tag == _DYNAMIC_TAG_NONE:
+        return None, offset
+    elif tag == _DYNAMIC_TAG_BOOL:
+        return _decode_bool(buffer, offset)
+    elif tag == _DYNAMIC_TAG_INT:
+        return _decode_int(buffer, offset)
+    elif tag == _DYNAMIC_TAG_FLOAT:
+        return _decode_float(buffer, offset)
+    elif tag == _DYNAMIC_TAG_STR:
+        return _decode_str(buffer, offset)
+    elif tag in [_DYNAMIC_TAG_LIST, _DYNAMIC_TAG_TUPLE, _DYNAMIC_TAG_SET]:
+        length, offset = _read_length(buffer, offset)
+        # Every dynamic element takes at least the byte of its tag.
+        _check_remaining(buffer, offset, length)
+        elements = list()
+        for _ in range(length):
+            element, offset = _decode_dynamic(buffer, offset)
+            elements.append(element)
+        if tag == _DYNAMIC_TAG_TUPLE:
+            return tuple(elements), offset
+        elif tag == _DYNAMIC_TAG_SET:
+            return set(elements), offset
+        return elements, offset
+    elif tag == _DYNAMIC_TAG_DICT:
+        length, offset = _read_length(buffer, offset)
+        _check_remaining(buffer, offset, length * 2)
+        elements = dict()
+        for _ in range(length):
+            element_key, offset = _decode_dynamic(buffer, offset)
+            elements[element_key], offset = _decode_dynamic(buffer, offset)
+        return elements, offset
+    else:
+        raise ValueError("Unknown dynamic type tag '{}' found at offset {} !".format(tag, offset - 1))
+
+
+def _make_sequence_codec(container_type: type, element_type) -> tuple[Encoder, Decoder]:
+    encode_element, decode_element = _get_codec(element_type)
+    
+    def encode(value, buffer: bytearray):
+        if type(value) is not container_type:
+            raise TypeError("The '{}' type cannot be encoded as '{}' !".format(type(value), container_type.__name__))
+        
+        _write_length(len(value), buffer)
+        for element in value:
+            encode_element(element, buffer)
+    
+    def decode(buffer: memoryview, offset: int):
+        length, offset = _read_length(buffer, offset)
+        elements = list()
+        for _ in range(length):
+            element, offset = decode_element(buffer, offset)
+            elements.append(element)
+        return (elements if container_type is list else container_type(elements)), offset
+    
+    return encode, decode
+
+
+def _make_fixed_tuple_codec(element_types: tuple) -> tuple[Encoder, Decoder]:
+    element_codecs = [_get_codec(element_type) for element_type in element_types]
+    
+    def encode(value, buffer: bytearray):
+        if type(value) is not tuple or len(value) != len(element_codecs):
+            raise TypeError("The '{}' value cannot be encoded as a tuple of {} elements !".format(
+                value, len(element_codecs)))
+        
+        for element, (encode_element, _) in zip(value, element_codecs):
+            encode_element(element, buffer)
+    
+    def decode(buffer: memoryview, offset: int):
+        elements = list()
+        for _, decode_element in element_codecs:
+            element, offset = decode_element(buffer, offset)
+            elements.append(element)
+        return tuple(elements), offset
+    
+    return encode, decode
+
+
+def _make_dict_codec(key_type, value_type) -> tuple[Encoder, Decoder]:
+    encode_key, decode_key = _get_codec(key_type)
+    encode_value, decode_value = _get_codec(value_type)
+    
+    def encode(value, buffer: bytearray):
+        if type(value) is not dict:
+            raise TypeError("The '{}' type cannot be encoded as 'dict' !".format(type(value)))
+        
+        _write_length(len(value), buffer)
+        for element_key, element_value in value.items():
+            encode_key(element_key, buffer)
+            encode_value(element_value, buffer)
+    
+    def decode(buffer: memoryview, offset: int):
+        length, offset = _read_length(buffer, offset)
+        elements = dict()
+        for _ in range(length):
+            element_key, offset = decode_key(buffer, offset)
+            elements[element_key], offset = decode_value(buffer, offset)
+        return elements, offset
+    
+    return encode, decode
+
+
+def _is_value_of_type(value, expected_type) -> bool:
+    """
+    Checks if a given value can be encoded with the codec of a given 'Union' member.
+    Primitives are compared strictly to prevent 'bool' values from being matched as 'int' ones.
+    """
+    
+    if expected_type is None or expected_type is type(None):
+        return value is None
+    
+    if expected_type is Any:
+        return True
+    
+    if expected_type in [str, int, bool, float]:
+        return type(value) is expected_type
+    
+    if get_origin(expected_type) is not None:
+        expected_type = get_origin(expected_type)
+    
+    return isinstance(value, expected_type)
+
+
+def _make_union_codec(member_types: tuple) -> tuple[Encoder, Decoder]:
+    if len(member_types) > 255:
+        raise TypeError("Unions with more than 255 types cannot be encoded !")
+    
+    member_codecs = [_get_codec(member_type) for member_type in member_types]
+    
+    def encode(value, buffer: bytearray):
+        for member_index, member_type in enumerate(member_types):
+            if _is_value_of_type(value, member_type):
+                buffer += _STRUCT_TAG.pack(member_index)
+                member_codecs[member_index][0](value, buffer)
+                return
+        
+        raise TypeError("The '{}' type cannot be encoded as any of '{}' !".format(type(value), member_types))
+    
+    def decode(buffer: memoryview, offset: int):
+        member_index = buffer[offset]
+        if member_index >= len(member_codecs):
+            raise ValueError("Invalid union member index '{}' found at offset {} !".format(member_index, offset))
+        return member_codecs[member_index][1](buffer, offset + _STRUCT_TAG.size)
+    
+    return encode, decode
+
+
+def _get_codec(expected_type) -> tuple[Encoder, Decoder]:
+    """
+    Gets the encoder and decoder pair for a given type annotation.
+    
+    :param expected_type: The type annotation of the value that will be encoded and decoded.
+    :return: A tuple containing the relevant encoder and decoder functions.
+    :raises TypeError: If the given type cannot be represented in the binary format.
+    """
+    
+    if expected_type is None or expected_type is type(None):
+        return _encode_none, _decode_none
+    
+    if expected_type is Any:
+        return _encode_dynamic, _decode_dynamic
+    
+    if expected_type is bool:
+        return _encode_bool, _decode_bool
+    elif expected_type is int:
+        return _encode_int, _decode_int
+    elif expected_type is float:
+        return _encode_float, _decode_float
+    elif expected_type is str:
+        return _encode_str, _decode_str
+    
+    type_origin = get_origin(expected_type)
+    type_args = get_args(expected_type)
+    
+    if type_origin is Union:
+        return _make_union_codec(type_args)
+    
+    if expected_type in [list, dict, tuple, set]:
+        return _encode_dynamic, _decode_dynamic
+    
+    if type_origin in [list, set]:
+        return _make_sequence_codec(type_origin, type_args[0] if len(type_args) == 1 else Any)
+    elif type_origin is tuple:
+        if len(type_args) == 2 and type_args[1] is Ellipsis:
+            return _make_sequence_codec(tuple, type_args[0])
+        return _make_fixed_tuple_codec(type_args)
+    elif type_origin is dict:
+        return _make_dict_codec(*(type_args if len(type_args) == 2 else (Any, Any)))
+    
+    if isinstance(expected_type, type) and issubclass(expected_type, ISerializable):
+        class_plan = get_class_plan(expected_type)
+        return class_plan.encode, class_plan.decode
+    
+    raise TypeError("The '{}' type cannot be represented in the binary format !".format(expected_type))
+
+
+def _describe_type(expected_type, described_classes: set) -> str:
+    """
+    Gets a canonical textual description of a given type annotation that is used to compute schema fingerprints.
+    Nested 'ISerializable' classes are described with their fields and are only expanded once.
+    Polymorphic classes are marked with their discriminator, the layouts of their subclasses aren't described since
+    they may be declared after the fingerprint was computed.
+    """
+    
+    # Composed types are checked first since 'list[int]' is an instance of 'type' before Python 3.11.
+    if get_origin(expected_type) is not None:
+        return "{}[{}]".format(
+            _describe_type(get_origin(expected_type), described_classes),
+            ",".join([_describe_type(type_arg, described_classes) for type_arg in get_args(expected_type)])
+        )
+    
+    if isinstance(expected_type, type) and issubclass(expected_type, ISerializable):
+        class_name = "{}.{}".format(expected_type.__module__, expected_type.__qualname__)
+        
+        if expected_type._discriminator_registry is not None:
+            class_name += "@{}".format(expected_type._discriminator_key)
+        
+        if expected_type in described_classes:
+            return class_name
+        described_classes.add(expected_type)
+        
+        return "{}{{{}}}".format(class_name, ",".join([
+            "{}:{}".format(field_name, _describe_type(field_type, described_classes))
+            for field_name, field_type in expected_type._get_field_types().items()
+        ]))
+    
+    if expected_type is None or expected_type is type(None):
+        return "None"
+    
+    if isinstance(expected_type, type):
+        return expected_type.__qualname__
+    
+    return repr(expected_type)
+
+
+def _get_root_class(serializable_class: type) -> type:
+    """
+    Gets the class whose plan is used for the root of a payload, which is the base of the polymorphic hierarchy of
+    the given class, or the class itself if it isn't polymorphic.
+    The base is used so that the payload of a subclass can be decoded through any class of its hierarchy.
+    """
+    
+    if serializable_class._discriminator_registry is None:
+        return serializable_class
+    
+    for parent_class in serializable_class.__mro__:
+        if "_discriminator_registry" in vars(parent_class):
+            return parent_class
+    
+    return serializable_class
+
+
+def get_class_plan(serializable_class: type) -> _ClassPlan:
+    """
+    Gets the precomputed plan used to encode and decode a given 'ISerializable' class, computing it if needed.
+    
+    :param serializable_class: The 'ISerializable' class for which the plan is needed.
+    :return: The relevant '_ClassPlan' object.
+    :raises TypeError: If one of the class' fields cannot be represented in the binary format.
+    """
+    
+    class_plan: Optional[_ClassPlan] = _class_plans.get(serializable_class)
+    
+    if class_plan is None:
+        class_plan = _ClassPlan(serializable_class)
+        
+        # Registering the plan early in case it is referenced by one of its own fields.
+        _class_plans[serializable_class] = class_plan
+        
+        try:
+            for field_name, field_type in serializable_class._get_field_types().items():
+                field_encoder, field_decoder = _get_codec(field_type)
+                class_plan.field_names.append(field_name)
+                class_plan.encoders.append(field_encoder)
+                class_plan.decoders.append(field_decoder)
+        except TypeError:
+            del _class_plans[serializable_class]
+            raise
+        
+        class_plan.fingerprint = hashlib.blake2b(
+            _describe_type(serializable_class, set()).encode("utf-8"), digest_size=FINGERPRINT_SIZE
+        ).digest()
+    
+    return class_plan
+
+
+def dumps(instance: ISerializable) -> bytes:
+    """
+    Encodes a given 'ISerializable' instance into the binary format.
+    
+    Polymorphic classes are encoded with the fingerprint of the base of their hierarchy followed by their tag.
+    
+    :param instance: The instance to encode.
+    :return: The encoded bytes, prefixed by the magic bytes and the class' schema fingerprint.
+    :raises TypeError: If a field's value doesn't match its type annotation, or if the type cannot be encoded.
+    :raises ValueError: If a field's value cannot be packed in the fixed-width primitives.
+    """
+    
+    class_plan = get_class_plan(_get_root_class(type(instance)))
+    
+    buffer = bytearray(BINARY_MAGIC)
+    buffer += class_plan.fingerprint
+    class_plan.encode(instance, buffer)
+    
+    return bytes(buffer)
+
+
+def loads(serializable_class: type, data: Union[bytes, bytearray, memoryview]):
+    """
+    Decodes a given binary payload into an instance of the given 'ISerializable' class.
+    
+    :param serializable_class: The class into which the data will be decoded.
+    :param data: The binary payload to decode.
+    :return: The decoded 'ISerializable' instance, which may be a subclass of the given class if it is polymorphic.
+    :raises ValueError: If the payload is malformed, truncated or was encoded with a different schema.
+    :raises TypeError: If the payload contains a class of the hierarchy that doesn't extend the given class.
+    """
+    
+    class_plan = get_class_plan(_get_root_class(serializable_class))
+    buffer = memoryview(data)
+    
+    if bytes(buffer[:len(BINARY_MAGIC)]) != BINARY_MAGIC:
+        raise ValueError("The given data doesn't start with the expected magic bytes !")
+    
+    offset = len(BINARY_MAGIC) + FINGERPRINT_SIZE
+    if bytes(buffer[len(BINARY_MAGIC):offset]) != class_plan.fingerprint:
+        raise ValueError("The given data's schema fingerprint doesn't match the one of '{}' !".format(
+            serializable_class.__name__))
+    
+    try:
+        instance, offset = class_plan.decode(buffer, offset)
+    except (struct.error, IndexError, UnicodeDecodeError) as err:
+        raise ValueError("The given data is truncated or malformed !") from err
+    
+    if offset != len(buffer):
+        raise ValueError("The given data has {} unexpected trailing bytes !".format(len(buffer) - offset))
+    
+    if not isinstance(instance, serializable_class):
+        raise TypeError("The given data contains a '{}' class which doesn't extend '{}' !".format(
+            type(instance).__name__, serializable_class.__name__))
+    
+    return instance
@@ -0,0 +1,129 @@
+# Imports
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable
+
+
+# Classes
+class LRUCache:
+    """
+    Bounded and thread-safe mapping that evicts its least recently used entries once its maximum size is reached.
+    
+    Used internally to cache results that are costly to compute and keyed by hashable objects.
+    """
+    
+    def __init__(self, max_size: int = 128):
+        """
+        :param max_size: Maximum amount of entries kept in the cache.  (0 disables the cache)
+        """
+        
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+        self._max_size = max_size
+        
+        self.hits: int = 0
+        """Amount of successful lookups since the creation or last reset of the cache."""
+        
+        self.misses: int = 0
+        """Amount of failed lookups since the creation or last reset of the cache."""
+        
+        self.evictions: int = 0
+        """Amount of entries that were evicted to make room for new ones."""
+    
+    @property
+    def max_size(self) -> int:
+        """Maximum amount of entries kept in the cache.  (0 disables the cache)"""
+        return self._max_size
+    
+    @max_size.setter
+    def max_size(self, value: int):
+        with self._lock:
+            self._max_size = max(value, 0)
+            self._evict()
+    
+    def _evict(self):
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Gets a value from the cache and marks it as the most recently used one.
+        
+        :param key: The key of the value to get.
+        :param default: The value returned if the key isn't cached.
+        :return: The cached value if found, 'default' otherwise.
+        """
+        
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key: Hashable, value: Any):
+        """
+        Adds or replaces a value in the cache and evicts the least recently used entries if needed.
+        
+        :param key: The key of the value to cache.
+        :param value: The value to cache.
+        """
+        
+        with self._lock:
+            if self._max_size <= 0:
+                return
+            
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+    
+    def clear(self, reset_stats: bool = True):
+        """
+        Removes every entry from the cache.
+        
+        :param reset_stats: Also resets the 'hits', 'misses' and 'evictions' counters.
+        """
+        
+        with self._lock:
+            self._entries.clear()
+            
+            if reset_stats:
+                self.hits = 0
+                self.misses = 0
+                self.evictions = 0
+    
+    def get_stats(self) -> dict[str, int]:
+        """
+        Gets a summary of the cache's usage.
+        
+        :return: A dictionary containing the 'size', 'max_size', 'hits', 'misses' and 'evictions' counters.
+        """
+        
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+
+# Globals
+json_payload_cache = LRUCache(max_size=256)
+"""
+Cache used by 'ISerializable.from_json' when 'use_payload_cache' is given to reuse the classes deserialized from
+identical payloads, indexed by the class, the options and a hash of the payload.
+Its size can be changed, or set to 0 to disable it, through its 'max_size' property.
+"""
@@ -0,0 +1,395 @@
+# Imports
+import bz2
+import codecs
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import IntEnum, auto
+import gzip
+import lzma
+import os
+import time
+from typing import Union, Optional, Iterable, Iterator, IO, Any
+
+from .interface import ISerializable
+from .options import DeserializeOptions
+from .streaming import iter_json_array, DEFAULT_CHUNK_SIZE
+
+
+# Enumerations
+class ECompressionCodec(IntEnum):
+    """
+    Enumeration of the compression codecs from the standard library that can be used to read and write files.
+    """
+    CODEC_NONE = auto()
+    CODEC_GZIP = auto()
+    CODEC_BZ2 = auto()
+    CODEC_LZMA = auto()
+
+
+# Constants
+_CODEC_EXTENSIONS: dict[str, ECompressionCodec] = {
+    ".gz": ECompressionCodec.CODEC_GZIP,
+    ".gzip": ECompressionCodec.CODEC_GZIP,
+    ".bz2": ECompressionCodec.CODEC_BZ2,
+    ".xz": ECompressionCodec.CODEC_LZMA,
+    ".lzma": ECompressionCodec.CODEC_LZMA,
+}
+
+_CODEC_MAGIC_BYTES: list[tuple[bytes, ECompressionCodec]] = [
+    (b"\x1f\x8b", ECompressionCodec.CODEC_GZIP),
+    (b"BZh", ECompressionCodec.CODEC_BZ2),
+    (b"\xfd7zXZ\x00", ECompressionCodec.CODEC_LZMA),
+]
+
+
+# Classes
+@dataclass
+class CompressedIOStats:
+    """
+    Statistics gathered while reading or writing a file, used to compare the throughput of the different codecs.
+    """
+    
+    codec: ECompressionCodec = ECompressionCodec.CODEC_NONE
+    """Codec used to read or write the file."""
+    
+    uncompressed_bytes: int = 0
+    """Amount of uncompressed bytes that were read or written."""
+    
+    compressed_bytes: int = 0
+    """Size of the file on the disk, only set once the file was fully read or written."""
+    
+    elements: int = 0
+    """Amount of 'ISerializable' classes that were read or written."""
+    
+    elapsed_seconds: float = 0.0
+    """
+    Time spent reading or writing the file, including the (de)serialization, but excluding the time spent by the code
+    that consumes or produces the classes.
+    """
+    
+    def get_throughput(self) -> float:
+        """
+        Gets the amount of uncompressed bytes processed per second.
+        
+        :return: The throughput in bytes per second, or 0 if no time was measured.
+        """
+        
+        return self.uncompressed_bytes / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+    
+    def get_compression_ratio(self) -> float:
+        """
+        Gets the ratio between the uncompressed and compressed sizes.
+        
+        :return: The compression ratio, or 0 if the compressed size is unknown.
+        """
+        
+        return self.uncompressed_bytes / self.compressed_bytes if self.compressed_bytes > 0 else 0.0
+
+
+class _CountingReader:
+    """
+    Minimal binary stream wrapper that counts the amount of bytes read through it.
+    
+    Should not be used outside this module !
+    """
+    
+    def __init__(self, stream: IO[bytes], stats: CompressedIOStats):
+        self._stream = stream
+        self._stats = stats
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._stats.uncompressed_bytes += len(data)
+        return data
+
+
+# Functions
+def detect_codec(file_path: Union[str, os.PathLike], check_magic_bytes: bool = True) -> ECompressionCodec:
+    """
+    Detects the compression codec of a given file from its extension, or from its first bytes if the extension
+    isn't known and the file exists.
+    
+    :param file_path: The path of the file.
+    :param check_magic_bytes: Reads the first bytes of the file if its extension isn't enough.
+    :return: The detected codec, or 'CODEC_NONE' if the file isn't compressed.
+    """
+    
+    file_extension = os.path.splitext(os.fspath(file_path))[1].lower()
+    
+    if file_extension in _CODEC_EXTENSIONS:
+        return _CODEC_EXTENSIONS[file_extension]
+    
+    if check_magic_bytes and os.path.isfile(file_path):
+        with open(file_path, "rb") as file:
+            return _detect_header_codec(file.read(6))
+    
+    return ECompressionCodec.CODEC_NONE
+
+
+def _detect_header_codec(file_header: bytes) -> ECompressionCodec:
+    """
+    Detects the compression codec of some data from its first bytes.
+    """
+    
+    for magic_bytes, codec in _CODEC_MAGIC_BYTES:
+        if file_header.startswith(magic_bytes):
+            return codec
+    
+    return ECompressionCodec.CODEC_NONE
+
+
+def open_compressed(file_path: Union[str, os.PathLike], mode: str = "rb", codec: Optional[ECompressionCodec] = None,
+                    compression_level: Optional[int] = None) -> IO[bytes]:
+    """
+    Opens a file as a binary stream that transparently compresses or decompresses its data on the fly.
+    
+    :param file_path: The path of the file.
+    :param mode: The mode in which the file is opened, either 'rb', 'wb', 'ab' or 'xb'.
+    :param codec: The codec to use, it is detected from the file if 'None'.
+    :param compression_level: The compression level, or LZMA preset, used when writing.  (None uses the default one)
+    :return: The opened binary stream.
+    :raises ValueError: If the mode isn't a supported binary mode.
+    """
+    
+    if mode not in ["rb", "wb", "ab", "xb"]:
+        raise ValueError("The '{}' mode is not supported, only binary modes can be used !".format(mode))
+    
+    if codec is None:
+        codec = detect_codec(file_path, check_magic_bytes=mode == "rb")
+    
+    # The compression level is only given when writing since it is refused by some codecs when reading.
+    compression_kwargs: dict[str, int] = dict()
+    if compression_level is not None and mode != "rb":
+        compression_kwargs["preset" if codec == ECompressionCodec.CODEC_LZMA else "compresslevel"] = compression_level
+    
+    if codec == ECompressionCodec.CODEC_GZIP:
+        return gzip.open(file_path, mode, **compression_kwargs)
+    elif codec == ECompressionCodec.CODEC_BZ2:
+        return bz2.open(file_path, mode, **compression_kwargs)
+    elif codec == ECompressionCodec.CODEC_LZMA:
+        return lzma.open(file_path, mode, **compression_kwargs)
+    
+    return open(file_path, mode)
+
+
+def read_compressed(file_path: Union[str, os.PathLike], codec: Optional[ECompressionCodec] = None) -> bytes:
+    """
+    Reads and decompresses a whole file in memory while only opening it once.
+    
+    Unlike 'open_compressed', the codec is detected from the data that was already read when the file's extension
+    isn't known, instead of opening the file a second time to read its first bytes.
+    
+    :param file_path: The path of the file.
+    :param codec: The codec to use, it is detected from the file's extension and data if 'None'.
+    :return: The decompressed data.
+    """
+    
+    with open(file_path, "rb") as file:
+        file_data = file.read()
+    
+    if codec is None:
+        codec = detect_codec(file_path, check_magic_bytes=False)
+        if codec == ECompressionCodec.CODEC_NONE:
+            codec = _detect_header_codec(file_data)
+    
+    if codec == ECompressionCodec.CODEC_GZIP:
+        return gzip.decompress(file_data)
+    elif codec == ECompressionCodec.CODEC_BZ2:
+        return bz2.decompress(file_data)
+    elif codec == ECompressionCodec.CODEC_LZMA:
+        return lzma.decompress(file_data)
+    
+    return file_data
+
+
+@contextmanager
+def _open_compressed_reader(file_path: Union[str, os.PathLike], stats: CompressedIOStats,
+                            codec: Optional[ECompressionCodec]) -> Iterator[IO[bytes]]:
+    """
+    Opens a compressed file for reading while only opening it once, the codec is detected from the file's extension,
+    or by peeking at the first bytes of the already opened file, and is stored in the given statistics.
+    """
+    
+    with open(file_path, "rb") as raw_stream:
+        if codec is None:
+            codec = detect_codec(file_path, check_magic_bytes=False)
+            if codec == ECompressionCodec.CODEC_NONE:
+                codec = _detect_header_codec(raw_stream.peek(6)[:6])
+        
+        stats.codec = codec
+        
+        if codec == ECompressionCodec.CODEC_GZIP:
+            stream = gzip.GzipFile(fileobj=raw_stream, mode="rb")
+        elif codec == ECompressionCodec.CODEC_BZ2:
+            stream = bz2.BZ2File(raw_stream, "rb")
+        elif codec == ECompressionCodec.CODEC_LZMA:
+            stream = lzma.LZMAFile(raw_stream, "rb")
+        else:
+            yield raw_stream
+            return
+        
+        with stream:
+            yield stream
+
+
+def iter_json_array_file(serializable_class: type, file_path: Union[str, os.PathLike],
+                         codec: Optional[ECompressionCodec] = None, options: Optional[DeserializeOptions] = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE, stats: Optional[CompressedIOStats] = None,
+                         encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Decompresses and deserializes a file containing a top-level JSON array in a single streaming pass.
+    
+    See 'mooss.serialize.streaming.iter_json_array' for more information.
+    
+    :param serializable_class: The 'ISerializable' class into which every element will be deserialized.
+    :param file_path: The path of the file.
+    :param codec: The codec to use, it is detected from the file if 'None'.
+    :param options: The options given to 'from_dict' for every element.
+    :param chunk_size: Amount of decompressed bytes read at once.
+    :param stats: Optional 'CompressedIOStats' object that will be filled while the file is read.
+    :param encoding: The text encoding of the uncompressed data.
+    :return: An iterator of deserialized 'ISerializable' classes.
+    """
+    
+    stats = stats if stats is not None else CompressedIOStats()
+    start_time = time.perf_counter()
+    
+    with _open_compressed_reader(file_path, stats, codec) as stream:
+        for instance in iter_json_array(serializable_class, _CountingReader(stream, stats), options, chunk_size,
+                                        encoding):
+            stats.elements += 1
+            
+            # The timer is paused while the consumer handles the class.
+            stats.elapsed_seconds += time.perf_counter() - start_time
+            yield instance
+            start_time = time.perf_counter()
+    
+    stats.compressed_bytes = os.path.getsize(file_path)
+    stats.elapsed_seconds += time.perf_counter() - start_time
+
+
+def iter_jsonl_file(serializable_class: type, file_path: Union[str, os.PathLike],
+                    codec: Optional[ECompressionCodec] = None, options: Optional[DeserializeOptions] = None,
+                    stats: Optional[CompressedIOStats] = None, encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Decompresses and deserializes a JSON Lines file in a single streaming pass, one line at a time.
+    
+    Empty lines are ignored.
+    
+    :param serializable_class: The 'ISerializable' class into which every line will be deserialized.
+    :param file_path: The path of the file.
+    :param codec: The codec to use, it is detected from the file if 'None'.
+    :param options: The options given to 'from_json' for every line.
+    :param stats: Optional 'CompressedIOStats' object that will be filled while the file is read.
+    :param encoding: The text encoding of the uncompressed data.
+    :return: An iterator of deserialized 'ISerializable' classes.
+    :raises TypeError: If the given class doesn't implement 'ISerializable'.
+    """
+    
+    if not (isinstance(serializable_class, type) and issubclass(serializable_class, ISerializable)):
+        raise TypeError("The '{}' class doesn't implement 'ISerializable' !".format(serializable_class))
+    
+    stats = stats if stats is not None else CompressedIOStats()
+    start_time = time.perf_counter()
+    
+    with _open_compressed_reader(file_path, stats, codec) as stream:
+        for raw_line in stream:
+            stats.uncompressed_bytes += len(raw_line)
+            
+            if len(raw_line.strip()) == 0:
+                continue
+            
+            stats.elements += 1
+            instance = serializable_class.from_json(data_json=raw_line.decode(encoding), options=options)
+            
+            # The timer is paused while the consumer handles the class.
+            stats.elapsed_seconds += time.perf_counter() - start_time
+            yield instance
+            start_time = time.perf_counter()
+    
+    stats.compressed_bytes = os.path.getsize(file_path)
+    stats.elapsed_seconds += time.perf_counter() - start_time
+
+
+def _write_instances(instances: Iterable[ISerializable], file_path: Union[str, os.PathLike],
+                     codec: Optional[ECompressionCodec], compression_level: Optional[int],
+                     stats: Optional[CompressedIOStats], encoding: str, prefix: str, separator: str,
+                     suffix: str) -> CompressedIOStats:
+    """
+    Serializes and compresses the given classes one at a time while surrounding and separating them with the given
+    strings.
+    The text is encoded incrementally so that encodings with a byte order mark only write it once.
+    """
+    
+    stats = stats if stats is not None else CompressedIOStats()
+    stats.codec = codec if codec is not None else detect_codec(file_path, check_magic_bytes=False)
+    start_time = time.perf_counter()
+    
+    text_encoder = codecs.getincrementalencoder(encoding)()
+    
+    with open_compressed(file_path, "wb", stats.codec, compression_level) as stream:
+        encoded_prefix = text_encoder.encode(prefix)
+        stream.write(encoded_prefix)
+        stats.uncompressed_bytes += len(encoded_prefix)
+        
+        stats.elapsed_seconds += time.perf_counter() - start_time
+        
+        # The timer is paused while the producer creates the next class.
+        for instance in instances:
+            start_time = time.perf_counter()
+            
+            encoded_instance = text_encoder.encode((separator if stats.elements > 0 else "") + instance.to_json())
+            stream.write(encoded_instance)
+            stats.uncompressed_bytes += len(encoded_instance)
+            stats.elements += 1
+            
+            stats.elapsed_seconds += time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        encoded_suffix = text_encoder.encode(suffix, final=True)
+        stream.write(encoded_suffix)
+        stats.uncompressed_bytes += len(encoded_suffix)
+    
+    stats.compressed_bytes = os.path.getsize(file_path)
+    stats.elapsed_seconds += time.perf_counter() - start_time
+    
+    return stats
+
+
+def write_jsonl_file(instances: Iterable[ISerializable], file_path: Union[str, os.PathLike],
+                     codec: Optional[ECompressionCodec] = None, compression_level: Optional[int] = None,
+                     stats: Optional[CompressedIOStats] = None, encoding: str = "utf-8") -> CompressedIOStats:
+    """
+    Serializes and compresses the given classes into a JSON Lines file in a single streaming pass.
+    
+    :param instances: An iterable, or generator, of 'ISerializable' classes.
+    :param file_path: The path of the file.
+    :param codec: The codec to use, it is detected from the file's extension if 'None'.
+    :param compression_level: The compression level, or LZMA preset.  (None uses the default one)
+    :param stats: Optional 'CompressedIOStats' object that will be filled while the file is written.
+    :param encoding: The text encoding of the uncompressed data.
+    :return: The 'CompressedIOStats' object containing the statistics of the write.
+    """
+    
+    return _write_instances(instances, file_path, codec, compression_level, stats, encoding,
+                            prefix="", separator="\n", suffix="\n")
+
+
+def write_json_array_file(instances: Iterable[ISerializable], file_path: Union[str, os.PathLike],
+                          codec: Optional[ECompressionCodec] = None, compression_level: Optional[int] = None,
+                          stats: Optional[CompressedIOStats] = None, encoding: str = "utf-8") -> CompressedIOStats:
+    """
+    Serializes and compresses the given classes into a file containing a top-level JSON array in a single
+    streaming pass.
+    
+    :param instances: An iterable, or generator, of 'ISerializable' classes.
+    :param file_path: The path of the file.
+    :param codec: The codec to use, it is detected from the file's extension if 'None'.
+    :param compression_level: The compression level, or LZMA preset.  (None uses the default one)
+    :param stats: Optional 'CompressedIOStats' object that will be filled while the file is written.
+    :param encoding: The text encoding of the uncompressed data.
+    :return: The 'CompressedIOStats' object containing the statistics of the write.
+    """
+    
+    return _write_instances(instances, file_path, codec, compression_level, stats, encoding,
+                            prefix="[", separator=",\n", suffix="]")
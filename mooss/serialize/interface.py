@@ -2,10 +2,180 @@
 from abc import ABC
 import copy
 from dataclasses import Field, MISSING
+from enum import Enum
+import hashlib
 import json
-from typing import Union, get_origin, get_args, Any, Optional
+import random
+import sys
+from types import GenericAlias
+from typing import Union, get_origin, get_args, get_type_hints, Any, Optional, Iterable, Callable
 
 from ._field_types import EFieldType
+from .cache import json_payload_cache
+from .options import DeserializeOptions, EListValidation, resolve_options, LIST_VALIDATION_METADATA_KEY, \
+    LIST_VALIDATION_COUNT_METADATA_KEY
+
+
+# Constants
+REFERENCE_ID_KEY = "$id"
+"""
+Key added to the dict of a shared 'ISerializable' instance the first time it is serialized with 'track_references'.
+"""
+
+REFERENCE_KEY = "$ref"
+"""
+Key of the dict that replaces any later occurrence of a shared 'ISerializable' instance.
+"""
+
+PAYLOAD_HASH_SIZE = 16
+"""
+Size in bytes of the hash of the payloads used as a key in 'json_payload_cache'.
+"""
+
+DATA_SHAPE_CACHE_SIZE = 256
+"""
+Maximum amount of data shapes cached for each class in '_data_shapes', any other layout is classified on every call.
+"""
+
+_IMMUTABLE_TYPES = frozenset([str, int, float, bool, bytes, type(None)])
+"""
+Types whose values can be shared as-is by '_copy_cached_value'.
+"""
+
+
+# Globals
+_field_fillers: dict[type, dict[str, tuple[Any, Optional[Callable[[], Any]]]]] = dict()
+"""
+Cache of the tables returned by '_get_field_fillers', indexed by their class.
+"""
+
+_field_types: dict[type, dict[str, Any]] = dict()
+"""
+Cache of the tables returned by '_get_field_types', indexed by their class.
+"""
+
+_data_shapes: dict[type, dict[tuple[tuple[str, ...], DeserializeOptions], tuple]] = dict()
+"""
+Cache of the tuples returned by '_get_data_shape', indexed by their class, and then by the ordered field names and
+options they were computed for.
+"""
+
+
+# Functions
+def _encode_json_set(value: Any) -> Any:
+    """
+    Default function given to 'json.dumps' in order to encode sets as lists.
+    """
+    
+    if isinstance(value, set):
+        return list(value)
+    
+    raise TypeError("Object of type '{}' is not JSON serializable".format(type(value).__name__))
+
+
+def _is_deeply_immutable(value: Any, visited_ids: Optional[set[int]] = None) -> bool:
+    """
+    Checks if a given value and everything it contains cannot be modified, which allows it to be shared safely.
+    
+    Frozen dataclasses are only shallowly immutable, so their attributes, including the unknown ones that were added
+    as-is, are also checked.
+    
+    :param value: The value to check.
+    :param visited_ids: Ids of the frozen classes already being checked, used to stop on cycles.
+    :return: True if the value can be shared, False otherwise.
+    """
+    
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes, Enum)):
+        return True
+    
+    if isinstance(value, (tuple, frozenset)):
+        return all(_is_deeply_immutable(element, visited_ids) for element in value)
+    
+    if isinstance(value, ISerializable) and type(value).__dataclass_params__.frozen:
+        visited_ids = visited_ids if visited_ids is not None else set()
+        if id(value) in visited_ids:
+            return True
+        visited_ids.add(id(value))
+        
+        return all(_is_deeply_immutable(attribute_value, visited_ids) for attribute_value in vars(value).values())
+    
+    return False
+
+
+def _resolve_string_annotations(field_type: Any, namespace: dict[str, Any]) -> Any:
+    """
+    Resolves the strings left in the arguments of builtin generics, such as 'list["Node"]', which aren't resolved by
+    'typing.get_type_hints' before Python 3.11.
+    
+    :param field_type: The type to resolve.
+    :param namespace: The names used to evaluate the strings.
+    :return: The resolved type, or the given one if nothing had to be resolved.
+    :raises NameError: If a string refers to an unknown name.
+    """
+    
+    if isinstance(field_type, str):
+        return eval(field_type, namespace)
+    
+    type_args = get_args(field_type)
+    
+    if len(type_args) == 0:
+        return field_type
+    
+    resolved_type_args = tuple(_resolve_string_annotations(type_arg, namespace) for type_arg in type_args)
+    
+    if resolved_type_args == type_args:
+        return field_type
+    
+    if get_origin(field_type) is Union:
+        return Union[resolved_type_args]
+    
+    if isinstance(field_type, GenericAlias):
+        return GenericAlias(get_origin(field_type), resolved_type_args)
+    
+    return field_type
+
+
+def _copy_cached_value(value: Any, copied_instances: dict[int, Any]) -> Any:
+    """
+    Copies a value returned by the payload cache by only copying its containers and 'ISerializable' classes.
+    
+    This is much cheaper than 'copy.deepcopy' since immutable primitives, which make up most of the parsed data, are
+    returned as-is without any bookkeeping, and classes are copied without calling their '__init__' method.
+    
+    :param value: The value to copy.
+    :param copied_instances: The copies of the classes already reached, indexed by the 'id' of the original ones,
+     which keeps shared instances and cycles intact.
+    :return: The copied value.
+    """
+    
+    value_type = type(value)
+    
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    elif value_type is list:
+        return [_copy_cached_value(element, copied_instances) for element in value]
+    elif value_type is dict:
+        return {
+            element_key: _copy_cached_value(element_value, copied_instances)
+            for element_key, element_value in value.items()
+        }
+    elif value_type is tuple:
+        return tuple([_copy_cached_value(element, copied_instances) for element in value])
+    elif value_type is set:
+        return set(value)
+    elif isinstance(value, ISerializable) and hasattr(value, "__dict__"):
+        value_copy = copied_instances.get(id(value))
+        
+        if value_copy is None:
+            value_copy = object.__new__(value_type)
+            copied_instances[id(value)] = value_copy
+            
+            for attribute_name, attribute_value in vars(value).items():
+                object.__setattr__(value_copy, attribute_name, _copy_cached_value(attribute_value, copied_instances))
+        
+        return value_copy
+    
+    return copy.deepcopy(value)
 
 
 # Classes
@@ -20,8 +190,82 @@ class ISerializable(ABC):
     when using this field.
     """
     
+    _discriminator_key: Optional[str] = None
+    """
+    Name of the key containing the tag of the concrete class in the serialized data of a polymorphic hierarchy.
+    Set through the 'discriminator' class parameter, and left as 'None' for classes outside of such hierarchies.
+    """
+    
+    _discriminator_tag: Any = None
+    """
+    Tag identifying the class in its polymorphic hierarchy, set through the 'tag' class parameter.
+    """
+    
+    _discriminator_registry: Optional[dict[Any, type]] = None
+    """
+    Classes of a polymorphic hierarchy indexed by their tag, shared by every class of the hierarchy.
+    """
+    
     # FIXME: Add check to see if the class is properly decorated !
     
+    def __init_subclass__(cls, discriminator: Optional[str] = None, tag: Any = None, **kwargs):
+        """
+        Declares the class as the base of a polymorphic hierarchy, or registers it in the one of its parents.
+        
+        :param discriminator: Name of the key containing the tag of the concrete class in the serialized data.
+        :param tag: Hashable value identifying the class in its polymorphic hierarchy.
+        :raises TypeError: If a tag is given without a discriminator being declared by the class or its parents.
+        :raises ValueError: If the tag is already used by another class of the hierarchy.
+        """
+        
+        super().__init_subclass__(**kwargs)
+        
+        if discriminator is not None:
+            cls._discriminator_key = discriminator
+            cls._discriminator_registry = dict()
+        
+        if cls._discriminator_registry is not None:
+            # Always set to prevent untagged subclasses from inheriting the tag of their parent.
+            cls._discriminator_tag = tag
+        
+        if tag is not None:
+            if cls._discriminator_registry is None:
+                raise TypeError("The '{}' class has a tag but neither it nor its parents declare a discriminator !"
+                                .format(cls.__name__))
+            
+            registered_class = cls._discriminator_registry.get(tag)
+            
+            # Classes that are declared again, when reloading a module for example, simply replace the previous one.
+            if registered_class is not None and \
+                    (registered_class.__module__, registered_class.__qualname__) != (cls.__module__, cls.__qualname__):
+                raise ValueError("The '{}' tag is already used by the '{}' class !".format(
+                    tag, registered_class.__name__))
+            
+            cls._discriminator_registry[tag] = cls
+    
+    @classmethod
+    def _get_tagged_class(cls, tag: Any) -> type:
+        """
+        Gets the class identified by a given tag in the polymorphic hierarchy of the class.
+        
+        :param tag: The value of the discriminator key in the data to deserialize.
+        :return: The class registered with the given tag.
+        :raises ValueError: If no class is registered with the given tag.
+        :raises TypeError: If the registered class doesn't extend this class.
+        """
+        
+        tagged_class = cls._discriminator_registry.get(tag)
+        
+        if tagged_class is None:
+            raise ValueError("The '{}' tag is not registered in the hierarchy of the '{}' class !".format(
+                tag, cls.__name__))
+        
+        if not issubclass(tagged_class, cls):
+            raise TypeError("The '{}' tag identifies the '{}' class which doesn't extend '{}' !".format(
+                tag, tagged_class.__name__, cls.__name__))
+        
+        return tagged_class
+    
     @classmethod
     def _get_serializable_fields(cls) -> dict[str, Field]:
         """
@@ -104,6 +348,10 @@ class ISerializable(ABC):
                 # print(">> Found a valid match for the union/optional !")
                 if analysed_data_result[0]:
                     return analysed_data_result
+        elif get_origin(expected_type) in [list, dict, tuple, set]:
+            # Composed types such as 'list[str]' are no longer instances of 'type' since Python 3.11 and need to be
+            #  caught before the next check.
+            return get_origin(expected_type) is actual_type, EFieldType.FIELD_TYPE_ITERABLE
         elif isinstance(expected_type, type):
             # print(">> Detected a 'type' type '{}'".format(expected_type))
             # print(">> origin:'{}' & args:'{}'".format(get_origin(expected_type), get_args(expected_type)))
@@ -156,7 +404,7 @@ class ISerializable(ABC):
         
         # Default return case when encountering supported types.
         return False, EFieldType.FIELD_TYPE_UNKNOWN
-
+    
     @classmethod
     def _is_type_valid(cls, expected_type, actual_type, process_listed_types: bool = False) -> bool:
         """
@@ -174,25 +422,304 @@ class ISerializable(ABC):
         return cls._analyse_type(expected_type, actual_type, process_listed_types)[0]
     
     @classmethod
-    def from_dict(cls, data_dict: dict, allow_unknown: bool = False, add_unknown_as_is: bool = False,
-                  allow_as_is_unknown_overloading: bool = False, allow_missing_required: bool = False,
-                  allow_missing_nullable: bool = True, add_unserializable_as_dict: bool = False,
-                  validate_type: bool = True, parsing_depth: int = -1, do_deep_copy: bool = False):
+    def _get_list_element_types(cls, expected_type) -> Optional[list]:
         """
-        Deserialize a given dict into the relevant serializable class.
+        Gets the types that the elements of a 'list[...]' type, or of the first one found in a 'Union', can have.
+        
+        :param expected_type: The class' annotation's type.
+        :return: The list of types given between the square brackets, or None if there are none.
+        """
+        
+        if get_origin(expected_type) is list:
+            return list(get_args(expected_type)) if len(get_args(expected_type)) > 0 else None
+        elif get_origin(expected_type) is Union:
+            for individual_expected_type in get_args(expected_type):
+                if get_origin(individual_expected_type) is list:
+                    return cls._get_list_element_types(individual_expected_type)
+        
+        return None
+    
+    @classmethod
+    def _get_serializable_class(cls, expected_types: list) -> Optional[type]:
+        """
+        Gets the first 'ISerializable' class found in a given list of types, including the ones in a 'Union'.
+        
+        :param expected_types: The list of types to search.
+        :return: The first 'ISerializable' class found, or None if there are none.
+        """
+        
+        for expected_type in expected_types:
+            if get_origin(expected_type) is Union:
+                serializable_class = cls._get_serializable_class(list(get_args(expected_type)))
+                if serializable_class is not None:
+                    return serializable_class
+            elif isinstance(expected_type, type) and issubclass(expected_type, ISerializable):
+                return expected_type
+        
+        return None
+    
+    @classmethod
+    def _get_validated_indexes(cls, field_definition: Field, list_length: int,
+                               options: DeserializeOptions) -> Iterable[int]:
+        """
+        Gets the indexes of the elements of a list whose type should be validated according to the list validation
+        policy of the given field, or of the given options.
+        
+        :param field_definition: The 'Field' object of the field whose value is a list.
+        :param list_length: The length of the list.
+        :param options: The options used to deserialize the data.
+        :return: An iterable of the indexes to validate.
+        :raises ValueError: If the policy isn't a valid 'EListValidation' value.
+        """
+        
+        list_validation = field_definition.metadata.get(LIST_VALIDATION_METADATA_KEY, options.list_validation)
+        list_validation_count = field_definition.metadata.get(
+            LIST_VALIDATION_COUNT_METADATA_KEY, options.list_validation_count)
+        
+        if list_validation == EListValidation.LIST_VALIDATION_OFF:
+            return range(0)
+        elif list_validation == EListValidation.LIST_VALIDATION_FULL or list_validation_count >= list_length:
+            return range(list_length)
+        elif list_validation == EListValidation.LIST_VALIDATION_FIRST:
+            return range(max(list_validation_count, 0))
+        elif list_validation == EListValidation.LIST_VALIDATION_SAMPLE:
+            return random.sample(range(list_length), max(list_validation_count, 0))
+        
+        raise ValueError("The '{}' list validation policy is not supported !".format(list_validation))
+    
+    @classmethod
+    def _get_field_types(cls) -> dict[str, Any]:
+        """
+        Gets the types of the serializable fields with their forward references, such as 'Optional["Node"]', and
+        string annotations resolved.
+        
+        The types are resolved once per class through 'typing.get_type_hints', the class itself can always be
+        referenced by its name, even if it was declared in a function.
+        The raw types of the 'Field' objects are used as-is if a reference cannot be resolved.
+        
+        :return: A dictionary containing the type of every serializable field with the field's name as the key.
+        """
+        
+        field_types = _field_types.get(cls)
+        
+        if field_types is None:
+            namespace = {**vars(sys.modules[cls.__module__]), cls.__name__: cls}
+            
+            try:
+                type_hints = get_type_hints(cls, localns={cls.__name__: cls})
+                type_hints = {
+                    field_name: _resolve_string_annotations(field_type, namespace)
+                    for field_name, field_type in type_hints.items()
+                }
+            except NameError:
+                type_hints = dict()
+            
+            field_types = {
+                field_name: type_hints.get(field_name, field_definition.type)
+                for field_name, field_definition in cls._get_serializable_fields().items()
+            }
+            
+            _field_types[cls] = field_types
+        
+        return field_types
+    
+    @classmethod
+    def _get_field_fillers(cls) -> dict[str, tuple[Any, Optional[Callable[[], Any]]]]:
+        """
+        Gets the precomputed table of the values used to fill the serializable fields that are missing from the data.
+        
+        The table is computed once per class since the 'Field' objects don't change after the class' declaration.
+        
+        :return: A dictionary containing every field that has a 'default' or 'default_factory' with the field's name
+         as the key, and a tuple with the default value and the default factory, which is None for constant defaults,
+         as the value.
+        """
+        
+        field_fillers = _field_fillers.get(cls)
+        
+        if field_fillers is None:
+            field_fillers = dict()
+            
+            for field_name, field_definition in cls._get_serializable_fields().items():
+                if field_definition.default_factory is not MISSING:
+                    field_fillers[field_name] = (None, field_definition.default_factory)
+                elif field_definition.default is not MISSING:
+                    field_fillers[field_name] = (field_definition.default, None)
+            
+            _field_fillers[cls] = field_fillers
+        
+        return field_fillers
+    
+    @classmethod
+    def _get_data_shape(cls, field_names, options: DeserializeOptions) \
+            -> tuple[tuple[str, ...], tuple[str, ...], tuple[tuple[str, Any, Optional[Callable[[], Any]]], ...]]:
+        """
+        Splits the given field names into known, kept unknown and missing fields with their default values.
+        
+        The result is cached in '_data_shapes' for each class, ordered field names and options since most inputs
+        share the same handful of layouts, which allows repeated layouts to skip the per-field classification.
+        The per-class tables aren't locked since concurrent misses can only store identical shapes.
+        
+        :param field_names: Names of the fields present in the data to deserialize.
+        :param options: The options used to deserialize the data.
+        :return: A tuple containing the known fields' names, the unknown fields' names that should be kept, and the
+         missing fields' names alongside their default value and default factory.
+        :raises ValueError: If an unknown field is given and cannot be allowed, or if a missing field has no default
+         value.
+        """
+        
+        field_names = tuple(field_names)
+        
+        class_data_shapes = _data_shapes.get(cls)
+        if class_data_shapes is None:
+            class_data_shapes = _data_shapes.setdefault(cls, dict())
+        
+        data_shape = class_data_shapes.get((field_names, options))
+        if data_shape is not None:
+            return data_shape
+        
+        known_field_names: list[str] = list()
+        unknown_field_names: list[str] = list()
+        
+        for field_name in field_names:
+            if cls._is_field_serializable(field_name):
+                known_field_names.append(field_name)
+            elif field_name == cls._discriminator_key:
+                # The tag was already used to pick the class and isn't a field.
+                continue
+            elif not options.allow_unknown:
+                raise ValueError("The field '{}' is not present in the '{}' class !".format(field_name, cls.__name__))
+            elif options.add_unknown_as_is:
+                unknown_field_names.append(field_name)
+        
+        missing_field_defaults: list[tuple[str, Any, Optional[Callable[[], Any]]]] = list()
+        field_fillers = cls._get_field_fillers()
+        
+        given_field_names = set(field_names)
+        
+        for expected_field_name in cls._get_serializable_fields():
+            if expected_field_name not in given_field_names:
+                # Checking if it has a default value or factory in its class' definition.
+                if expected_field_name not in field_fillers:
+                    raise ValueError("Could not get a default value for the '{}' expected field in '{}' !".format(
+                        expected_field_name, cls.__name__
+                    ))
+                missing_field_defaults.append((expected_field_name, *field_fillers[expected_field_name]))
+        
+        data_shape = (tuple(known_field_names), tuple(unknown_field_names), tuple(missing_field_defaults))
+        
+        if len(class_data_shapes) < DATA_SHAPE_CACHE_SIZE:
+            class_data_shapes[(field_names, options)] = data_shape
+        
+        return data_shape
+    
+    @classmethod
+    def _deserialize_field_value(cls, field_definition: Field, field_value: Any, options: DeserializeOptions,
+                                 parsing_depth: int, references: Optional["_ReferenceRegistry"] = None) -> Any:
+        """
+        Validates and deserializes the value of a given serializable field.
+        
+        :param field_definition: The 'Field' object of the field whose value is being processed.
+        :param field_value: The raw value of the field.
+        :param options: The options used to deserialize the data.
+        :param parsing_depth: The remaining recursive depth to which the deserialization process will go.
+        :param references: The registry of the shared instances, only given if 'resolve_references' is used.
+        :return: The deserialized value, or the given value if it doesn't need to be deserialized.
+        :raises TypeError: If a mismatch between the expected and received data's types is found, requires
+         'validate_type' to be set to 'True'.
+        """
+        
+        field_type = cls._get_field_types()[field_definition.name]
+        
+        # Getting some info on the field and its type for later.
+        is_type_valid, field_simplified_type = cls._analyse_type(
+            expected_type=field_type,
+            actual_type=type(field_value),
+            process_listed_types=False)
+        # print(">> Grabbed more info: is_type_Valid:{}, field_simplified_type:{}".format(
+        #     is_type_valid, field_simplified_type
+        # ))
+        
+        # Checking if the expected types are compatible.
+        if options.validate_type and not is_type_valid:
+            raise TypeError("The '{type_actual}' type is supported by '{type_expected}'".format(
+                type_actual=type(field_value),
+                type_expected=field_type
+            ))
+        
+        # print("FIELD_TYPE_UNKNOWN => '{}'".format(EFieldType.FIELD_TYPE_UNKNOWN))
+        # print("FIELD_TYPE_PRIMITIVE => '{}'".format(EFieldType.FIELD_TYPE_PRIMITIVE))
+        # print("FIELD_TYPE_ITERABLE => '{}'".format(EFieldType.FIELD_TYPE_ITERABLE))
+        # print("FIELD_TYPE_SERIALIZABLE => '{}'".format(EFieldType.FIELD_TYPE_SERIALIZABLE))
+        
+        # Attempting to parse the data if, and only if, it is needed to do so.
+        if field_simplified_type == EFieldType.FIELD_TYPE_ITERABLE and isinstance(field_value, list) and \
+                len(field_value) > 0:
+            # We are checking for potentially listed 'ISerializable' classes.
+            # print(">> Type: Is iterable !")
+            
+            listed_types = cls._get_list_element_types(field_type)
+            
+            if listed_types is not None:
+                if options.validate_type:
+                    # Only validating the elements picked by the list validation policy.
+                    for element_index in cls._get_validated_indexes(field_definition, len(field_value), options):
+                        if not cls._is_type_valid(expected_type=listed_types,
+                                                  actual_type=type(field_value[element_index]),
+                                                  process_listed_types=True):
+                            raise TypeError("The '{type_actual}' type of the element #{index} is not supported by "
+                                            "'{type_expected}'".format(type_actual=type(field_value[element_index]),
+                                                                       index=element_index,
+                                                                       type_expected=field_type))
+                
+                serializable_class = cls._get_serializable_class(listed_types)
+                
+                if serializable_class is not None:
+                    field_value = [
+                        serializable_class._from_dict(
+                            data_dict=element,
+                            options=options,
+                            parsing_depth=parsing_depth - 1,
+                            references=references,
+                        ) if isinstance(element, dict) else element
+                        for element in field_value
+                    ]
+        
+        if field_simplified_type == EFieldType.FIELD_TYPE_SERIALIZABLE:
+            # print(">> Type: Is serializable ! -> {}".format(field_type))
+            # print(">> |_> {}".format(field_value))
+            
+            # Using the first 'ISerializable' class of any union since it is the one matched by '_analyse_type'.
+            serializable_class = cls._get_serializable_class([field_type])
+            
+            field_value = serializable_class._from_dict(
+                data_dict=field_value,
+                options=options,
+                parsing_depth=parsing_depth - 1,
+                references=references,
+            )
+            
+            # print(">> |_> {}".format(field_value))
+        else:
+            # print(">> Type: Other/primitive/list, will be using it as-is !")
+            pass
+        
+        return field_value
+    
+    @classmethod
+    def _from_dict(cls, data_dict: dict, options: DeserializeOptions, parsing_depth: int,
+                   references: Optional["_ReferenceRegistry"] = None):
+        """
+        Deserialize a given dict into the relevant serializable class with the given options.
+        
+        The given options are passed down unchanged to nested classes, only the remaining depth is modified.
         
         :param data_dict: Dictionary containing the data to deserialize.
-        :param allow_unknown: Allow unknown fields to be processed, other parameters will determine their use if 'True'.
-        :param add_unknown_as_is: Adds unknown fields/values as-is in the final class if 'allow_unknown' is also 'True'.
-        :param allow_as_is_unknown_overloading: Allow unknown fields/values to overload existing class attributes.
-        :param allow_missing_required: ! Not used yet !
-        :param allow_missing_nullable: ! Not used yet !
-        :param add_unserializable_as_dict: ! Not used yet !
-        :param validate_type: Enables a strict type check between the class' serializable fields and the given data.
-        :param parsing_depth: The recursive depth to which the deserialization process will go.  (-1 means infinite)
-        :param do_deep_copy: Performs a deep copy of the given 'data_dict' to prevent modifications from affecting
-        other variables that may reference it.
-        :return: The parsed 'ISerializable' class.
+        :param options: The options used to deserialize the data.
+        :param parsing_depth: The remaining recursive depth to which the deserialization process will go.
+        :param references: The registry of the shared instances, only given if 'resolve_references' is used.
+        :return: The parsed 'ISerializable' class, or a placeholder if it references an instance that is still being
+         deserialized.
         :raises TypeError: If a mismatch between the expected and received data's types is found, requires
          'validate_type' to be set to 'True'.
         :raises ValueError: If an unknown field is given and cannot be allowed or added back in the final class.
@@ -204,13 +731,39 @@ class ISerializable(ABC):
         
         # FIXME: Check for missing required fields, or let the interpreter do it during instantiation ?
         
-        # print("> from_dict: '{}', '{}'".format(data_dict, allow_unknown))
+        # print("> from_dict: '{}', '{}'".format(data_dict, options))
         
         # Checking if we have reached the end of the allowed recursive depth.
         if parsing_depth == 0:
             # print(">> Returning early due to recursive depth. !")
             return data_dict
         
+        # Dispatching the data to the concrete class identified by its tag in polymorphic hierarchies.
+        if cls._discriminator_registry is not None and cls._discriminator_key in data_dict:
+            tagged_class = cls._get_tagged_class(data_dict[cls._discriminator_key])
+            
+            if tagged_class is not cls:
+                return tagged_class._from_dict(
+                    data_dict=data_dict,
+                    options=options,
+                    parsing_depth=parsing_depth,
+                    references=references,
+                )
+        
+        # Handling the markers of shared instances.
+        reference_id: Any = None
+        if references is not None:
+            if REFERENCE_KEY in data_dict:
+                return references.get_instance(data_dict[REFERENCE_KEY], cls)
+            
+            if REFERENCE_ID_KEY in data_dict:
+                reference_id = data_dict[REFERENCE_ID_KEY]
+                references.declare_instance(reference_id, cls)
+                data_dict = {
+                    field_name: field_value for field_name, field_value in data_dict.items()
+                    if field_name != REFERENCE_ID_KEY
+                }
+        
         # Checking for unknown fields.
         _temp_data_dict: dict[str, Any] = dict()
         """
@@ -218,129 +771,56 @@ class ISerializable(ABC):
         changing values in the potentially referenced 'data_dict' value.
         """
         
-        _unknown_data: Optional[dict[str, Any]] = dict() if allow_unknown and add_unknown_as_is else None
+        _unknown_data: Optional[dict[str, Any]] = dict() \
+            if options.allow_unknown and options.add_unknown_as_is else None
         """
         Nullable dictionary that may exist and contain any unknown field that will be handled when instantiating the
         'ISerializable' class itself.
         May be left as 'None' if it shouldn't be used !
         """
         
-        for field_name, field_value in data_dict.items():
-            # print(">> Checking what to do with '{}'...".format(field_name))
-            if not cls._is_field_serializable(field_name):
-                if allow_unknown:
-                    if add_unknown_as_is:
-                        # print(">> Separating")
-                        # Separating this field into '_unknown_data' for later.
-                        _unknown_data[field_name] = copy.deepcopy(field_value) \
-                            if do_deep_copy else copy.copy(field_value)
-                    else:
-                        # print(">> Removing by ignoring it")
-                        # Ignoring this field safely by not copying it in the '_temp_data_dict' dict.
-                        pass
-                else:
-                    # print(">> Raising error")
-                    # Not allowing any.
-                    raise ValueError("The field '{}' is not present in the '{}' class !".format(
-                        field_name, cls.__name__))
-            else:
-                # print(">> Copying")
-                # Copying any other valid fields as-is.
-                _temp_data_dict[field_name] = copy.deepcopy(field_value) \
-                    if do_deep_copy else copy.copy(field_value)
-        
-        # Analysing all valid fields before using them to instantiate a new 'ISerializable' class.
-        for expected_field_name, expected_field_definition in cls._get_serializable_fields().items():
-            # print(">> Analysing '{}' => '{}'...".format(expected_field_name, expected_field_definition))
-            
-            # Checking if the field is present in the given data and fixing it if possible.
-            if expected_field_name not in _temp_data_dict:
-                # print(">> Not found in given dict !")
-                # Checking if it has a default value in its class' definition.
-                if expected_field_definition.default is MISSING:
-                    raise ValueError("Could not get a default value for the '{}' expected field in '{}' !".format(
-                        expected_field_name, cls.__name__
-                    ))
-                else:
-                    # print(">> Assigned '{}' as default value !".format(expected_field_definition.default))
-                    # TODO: Check if Field lists work properly !
-                    _temp_data_dict[expected_field_name] = expected_field_definition.default
-            
-            # Getting some info on the field and its type for later.
-            is_type_valid, field_simplified_type = cls._analyse_type(
-                expected_type=expected_field_definition.type,
-                actual_type=type(_temp_data_dict.get(expected_field_name)),
-                process_listed_types=False)
-            # print(">> Grabbed more info: is_type_Valid:{}, field_simplified_type:{}".format(
-            #     is_type_valid, field_simplified_type
-            # ))
-            
-            # Checking if the expected types are compatible.
-            if validate_type and not is_type_valid:
-                raise TypeError("The '{type_actual}' type is supported by '{type_expected}'".format(
-                    type_actual=type(_temp_data_dict.get(expected_field_name)),
-                    type_expected=expected_field_definition.type
-                ))
-            
-            # print("FIELD_TYPE_UNKNOWN => '{}'".format(EFieldType.FIELD_TYPE_UNKNOWN))
-            # print("FIELD_TYPE_PRIMITIVE => '{}'".format(EFieldType.FIELD_TYPE_PRIMITIVE))
-            # print("FIELD_TYPE_ITERABLE => '{}'".format(EFieldType.FIELD_TYPE_ITERABLE))
-            # print("FIELD_TYPE_SERIALIZABLE => '{}'".format(EFieldType.FIELD_TYPE_SERIALIZABLE))
-            
-            # Attempting to parse the data if, and only if, it is needed to do so.
-            if field_simplified_type == EFieldType.FIELD_TYPE_ITERABLE:
-                # We are checking for potentially listed 'ISerializable' classes.
-                # print(">> Type: Is iterable !")
-                
-                is_listed_type_valid, listed_field_simplified_type = cls._analyse_type(
-                    expected_type=get_args(expected_field_definition.type),
-                    actual_type=type(_temp_data_dict.get(expected_field_name)[0]),
-                    process_listed_types=True)
-                # print(">> Grabbed more info on listed type: is_type_Valid:{}, field_simplified_type:{}".format(
-                #     is_listed_type_valid, listed_field_simplified_type
-                # ))
-                
-                """
-                return [cls._deserialize_value(
-                    value_class=get_args(value_class)[0],
-                    value_data=x,
-                    allow_unknown=allow_unknown
-                ) for x in value_data]
-                """
+        # Splitting the given fields into known, unknown and missing ones through a cached partition.
+        known_field_names, unknown_field_names, missing_field_defaults = cls._get_data_shape(
+            field_names=data_dict.keys(),
+            options=options,
+        )
+        
+        for field_name in known_field_names:
+            # Copying any valid fields as-is before analysing them.
+            field_value = copy.deepcopy(data_dict[field_name]) \
+                if options.do_deep_copy else copy.copy(data_dict[field_name])
             
-            if field_simplified_type == EFieldType.FIELD_TYPE_SERIALIZABLE:
-                # print(">> Type: Is serializable ! -> {}".format(expected_field_definition.type))
-                # print(">> |_> {}".format(_temp_data_dict.get(expected_field_name)))
-                
-                _temp_data_dict[expected_field_name] = expected_field_definition.type.from_dict(
-                    data_dict=_temp_data_dict.get(expected_field_name),
-                    allow_unknown=allow_unknown,
-                    add_unknown_as_is=add_unknown_as_is,
-                    allow_as_is_unknown_overloading=allow_as_is_unknown_overloading,
-                    allow_missing_required=allow_missing_required,
-                    allow_missing_nullable=allow_missing_nullable,
-                    add_unserializable_as_dict=add_unserializable_as_dict,
-                    validate_type=validate_type,
-                    parsing_depth=parsing_depth - 1,
-                    do_deep_copy=do_deep_copy,
-                )
-                
-                # print(">> |_> {}".format(_temp_data_dict.get(expected_field_name)))
-            else:
-                # print(">> Type: Other/primitive/list, will be using it as-is !")
-                pass
+            _temp_data_dict[field_name] = cls._deserialize_field_value(
+                field_definition=cls._get_field_definition(field_name),
+                field_value=field_value,
+                options=options,
+                parsing_depth=parsing_depth,
+                references=references,
+            )
+        
+        if _unknown_data is not None:
+            for field_name in unknown_field_names:
+                # Separating this field into '_unknown_data' for later.
+                _unknown_data[field_name] = copy.deepcopy(data_dict[field_name]) \
+                    if options.do_deep_copy else copy.copy(data_dict[field_name])
+        
+        for field_name, field_default, field_default_factory in missing_field_defaults:
+            # Default values come from the class itself and are used as-is without being analysed.
+            # Factories are called for every class to prevent mutable defaults from being shared.
+            _temp_data_dict[field_name] = field_default if field_default_factory is None else field_default_factory()
         
         # TODO: Implement check for nullable fields !
         # TODO: Unknowns & default values !
         
-        if allow_unknown and add_unknown_as_is:
-            # Preparing, modifying, and then returning the class.
-            _tmp_class = cls(**_temp_data_dict)
-            
+        # Preparing the class.
+        _tmp_class = cls(**_temp_data_dict)
+        
+        if _unknown_data is not None:
+            # Modifying the class.
             for unknown_field_name, unknown_field_value in _unknown_data.items():
                 # print(">> Adding unknown field named '{}'".format(unknown_field_name))
                 if hasattr(_tmp_class, unknown_field_name):
-                    if allow_as_is_unknown_overloading:
+                    if options.allow_as_is_unknown_overloading:
                         # print(">> Will be overloading existing attribute !")
                         setattr(_tmp_class, unknown_field_name, unknown_field_value)
                     else:
@@ -350,21 +830,103 @@ class ISerializable(ABC):
                 else:
                     # print(">> Adding new non-existent attribute !")
                     setattr(_tmp_class, unknown_field_name, unknown_field_value)
-            
-            # Now returning the class :)
-            return _tmp_class
-        else:
-            # Preparing and returning the class directly.
-            return cls(**_temp_data_dict)
+        
+        if reference_id is not None:
+            references.register_instance(reference_id, _tmp_class)
+        
+        # Now returning the class :)
+        return _tmp_class
     
     @classmethod
-    def from_json(cls, data_json: str, allow_unknown: bool = False, add_unknown_as_is: bool = False,
-                  allow_as_is_unknown_overloading: bool = False, allow_missing_required: bool = False,
-                  allow_missing_nullable: bool = True, add_unserializable_as_dict: bool = False,
-                  validate_type: bool = True, parsing_depth: int = -1):
+    def _from_root_dict(cls, data_dict: dict, options: DeserializeOptions):
+        """
+        Deserialize a given dict into the relevant serializable class and resolves the references to shared instances
+        it contains if 'resolve_references' is used.
+        
+        :param data_dict: Dictionary containing the data to deserialize.
+        :param options: The options used to deserialize the data.
+        :return: The parsed 'ISerializable' class.
+        """
+        
+        if not options.resolve_references:
+            return cls._from_dict(data_dict=data_dict, options=options, parsing_depth=options.parsing_depth)
+        
+        references = _ReferenceRegistry()
+        
+        return references.resolve_pending_references(cls._from_dict(
+            data_dict=data_dict,
+            options=options,
+            parsing_depth=options.parsing_depth,
+            references=references,
+        ))
+    
+    @classmethod
+    def from_dict(cls, data_dict: dict, allow_unknown: Optional[bool] = None, add_unknown_as_is: Optional[bool] = None,
+                  allow_as_is_unknown_overloading: Optional[bool] = None,
+                  allow_missing_required: Optional[bool] = None, allow_missing_nullable: Optional[bool] = None,
+                  add_unserializable_as_dict: Optional[bool] = None, validate_type: Optional[bool] = None,
+                  parsing_depth: Optional[int] = None, do_deep_copy: Optional[bool] = None,
+                  options: Optional[DeserializeOptions] = None):
+        """
+        Deserialize a given dict into the relevant serializable class.
+        
+        The individual options are kept for compatibility and override the ones in 'options' when they are not 'None',
+        their default values are the ones of the 'DeserializeOptions' class.
+        
+        :param data_dict: Dictionary containing the data to deserialize.
+        :param allow_unknown: Allow unknown fields to be processed, other parameters will determine their use if 'True'.
+        :param add_unknown_as_is: Adds unknown fields/values as-is in the final class if 'allow_unknown' is also 'True'.
+        :param allow_as_is_unknown_overloading: Allow unknown fields/values to overload existing class attributes.
+        :param allow_missing_required: ! Not used yet !
+        :param allow_missing_nullable: ! Not used yet !
+        :param add_unserializable_as_dict: ! Not used yet !
+        :param validate_type: Enables a strict type check between the class' serializable fields and the given data.
+        :param parsing_depth: The recursive depth to which the deserialization process will go.  (-1 means infinite)
+        :param do_deep_copy: Performs a deep copy of the given 'data_dict' to prevent modifications from affecting
+        other variables that may reference it.
+        :param options: A 'DeserializeOptions' object, or one of its presets, containing all the options at once.
+        :return: The parsed 'ISerializable' class.
+        :raises TypeError: If a mismatch between the expected and received data's types is found, requires
+         'validate_type' to be set to 'True'.
+        :raises ValueError: If an unknown field is given and cannot be allowed or added back in the final class.
+        """
+        
+        options = resolve_options(
+            options,
+            allow_unknown=allow_unknown,
+            add_unknown_as_is=add_unknown_as_is,
+            allow_as_is_unknown_overloading=allow_as_is_unknown_overloading,
+            allow_missing_required=allow_missing_required,
+            allow_missing_nullable=allow_missing_nullable,
+            add_unserializable_as_dict=add_unserializable_as_dict,
+            validate_type=validate_type,
+            parsing_depth=parsing_depth,
+            do_deep_copy=do_deep_copy,
+        )
+        
+        return cls._from_root_dict(data_dict=data_dict, options=options)
+    
+    @classmethod
+    def from_json(cls, data_json: str, allow_unknown: Optional[bool] = None, add_unknown_as_is: Optional[bool] = None,
+                  allow_as_is_unknown_overloading: Optional[bool] = None,
+                  allow_missing_required: Optional[bool] = None, allow_missing_nullable: Optional[bool] = None,
+                  add_unserializable_as_dict: Optional[bool] = None, validate_type: Optional[bool] = None,
+                  parsing_depth: Optional[int] = None, options: Optional[DeserializeOptions] = None,
+                  use_payload_cache: bool = False):
         """
         Deserialize a given json-encoded dict into the relevant serializable class.
         
+        The individual options are kept for compatibility and override the ones in 'options' when they are not 'None',
+        their default values are the ones of the 'DeserializeOptions' class.
+        The 'do_deep_copy' option is ignored since the parsed data isn't referenced anywhere else.
+        
+        If 'use_payload_cache' is used, the deserialized class is kept in 'mooss.serialize.cache.json_payload_cache'
+        and identical payloads skip both the parsing and the deserialization.
+        The cached class is returned directly if it is deeply immutable, which requires a frozen dataclass whose
+        values and nested classes are all immutable, a copy of it is returned otherwise.
+        This copy only duplicates the containers and classes without calling their '__init__' method, which makes it
+        several times cheaper than parsing the payload again.
+        
         :param data_json: Json string containing the data to parse and then deserialize.
         :param allow_unknown: Allow unknown fields to be processed, other parameters will determine their use if 'True'.
         :param add_unknown_as_is: Adds unknown fields/values as-is in the final class if 'allow_unknown' is also 'True'.
@@ -374,6 +936,8 @@ class ISerializable(ABC):
         :param add_unserializable_as_dict: ! Not used yet !
         :param validate_type: Enables a strict type check between the class' serializable fields and the given data.
         :param parsing_depth: The recursive depth to which the deserialization process will go.  (-1 means infinite)
+        :param options: A 'DeserializeOptions' object, or one of its presets, containing all the options at once.
+        :param use_payload_cache: Reuses the class deserialized from an identical payload with the same options.
         :return: The parsed 'ISerializable' class.
         :raises TypeError: If a mismatch between the expected and received data's types is found, requires
          'validate_type' to be set to 'True'.
@@ -381,8 +945,8 @@ class ISerializable(ABC):
         :raises JSONDecodeError: If the given 'data_json' is not a properly formatted JSON string.
         """
         
-        return cls.from_dict(
-            data_dict=json.loads(data_json),
+        options = resolve_options(
+            options,
             allow_unknown=allow_unknown,
             add_unknown_as_is=add_unknown_as_is,
             allow_as_is_unknown_overloading=allow_as_is_unknown_overloading,
@@ -391,8 +955,580 @@ class ISerializable(ABC):
             add_unserializable_as_dict=add_unserializable_as_dict,
             validate_type=validate_type,
             parsing_depth=parsing_depth,
-            do_deep_copy=False,
         )
+        
+        if options.do_deep_copy:
+            options = options.replace(do_deep_copy=False)
+        
+        if not use_payload_cache:
+            return cls._from_root_dict(data_dict=json.loads(data_json), options=options)
+        
+        payload_key = (cls, options, hashlib.blake2b(
+            data_json.encode("utf-8") if isinstance(data_json, str) else data_json, digest_size=PAYLOAD_HASH_SIZE
+        ).digest())
+        cached_entry = json_payload_cache.get(payload_key)
+        
+        if cached_entry is None:
+            cached_class = cls._from_root_dict(data_dict=json.loads(data_json), options=options)
+            cached_entry = (cached_class, _is_deeply_immutable(cached_class))
+            json_payload_cache.put(payload_key, cached_entry)
+        
+        # Mutable classes are copied to prevent modifications from affecting the cached class.
+        cached_class, is_shareable = cached_entry
+        return cached_class if is_shareable else _copy_cached_value(cached_class, dict())
+    
+    def _prepare_update(self, patch_dict: dict, options: DeserializeOptions, parsing_depth: int,
+                        references: Optional["_ReferenceRegistry"] = None) -> list[tuple[Any, str, Any]]:
+        """
+        Validates and deserializes a given patch without modifying the class.
+        
+        :param patch_dict: Dictionary containing the fields to update.
+        :param options: The options used to deserialize the patch.
+        :param parsing_depth: The remaining recursive depth to which the update process will go.
+        :param references: The registry of the shared instances, only given if 'resolve_references' is used.
+        :return: A list of tuples containing the object to modify, the attribute's name and its new value.
+        :raises TypeError: If a mismatch between the expected and received data's types is found, requires
+         'validate_type' to be set to 'True'.
+        :raises ValueError: If an unknown field is given and cannot be allowed or added back in the class.
+        """
+        
+        _assignments: list[tuple[Any, str, Any]] = list()
+        
+        for field_name, field_value in patch_dict.items():
+            if self._is_field_serializable(field_name):
+                current_value = getattr(self, field_name)
+                
+                if isinstance(current_value, ISerializable) and isinstance(field_value, dict) and \
+                        (parsing_depth > 1 or parsing_depth < 0) and current_value._discriminator_tag == \
+                        field_value.get(current_value._discriminator_key, current_value._discriminator_tag):
+                    # Updating the existing nested class instead of replacing it.
+                    nested_assignments = current_value._prepare_update(
+                        patch_dict=field_value,
+                        options=options,
+                        parsing_depth=parsing_depth - 1,
+                        references=references,
+                    )
+                    
+                    if type(current_value).__dataclass_params__.frozen:
+                        # Frozen classes cannot be modified in-place, an updated copy replaces them instead.
+                        _assignments.append((self, field_name, current_value._copy_with_assignments(
+                            nested_assignments)))
+                        _assignments.extend(
+                            assignment for assignment in nested_assignments if assignment[0] is not current_value)
+                    else:
+                        _assignments.extend(nested_assignments)
+                else:
+                    _assignments.append((self, field_name, self._deserialize_field_value(
+                        field_definition=self._get_field_definition(field_name),
+                        field_value=copy.deepcopy(field_value) if options.do_deep_copy else copy.copy(field_value),
+                        options=options,
+                        parsing_depth=parsing_depth,
+                        references=references,
+                    )))
+            elif field_name == self._discriminator_key and field_value == self._discriminator_tag:
+                # The tag of the class itself, as given by 'to_dict', doesn't need to be applied.
+                continue
+            elif not options.allow_unknown:
+                raise ValueError("The field '{}' is not present in the '{}' class !".format(
+                    field_name, type(self).__name__))
+            elif options.add_unknown_as_is:
+                if hasattr(self, field_name) and not options.allow_as_is_unknown_overloading:
+                    raise ValueError("The unknown field '{}' cannot overload existing attributes !".format(field_name))
+                
+                _assignments.append((self, field_name,
+                                     copy.deepcopy(field_value) if options.do_deep_copy else copy.copy(field_value)))
+        
+        return _assignments
+    
+    def _copy_with_assignments(self, assignments: list[tuple[Any, str, Any]]) -> "ISerializable":
+        """
+        Creates a shallow copy of the class with the assignments targeting it applied, without calling its
+        '__init__' or '__setattr__' methods so that frozen classes can be updated.
+        
+        :param assignments: The assignments returned by '_prepare_update', the ones targeting other objects are
+         ignored.
+        :return: The updated copy of the class.
+        """
+        
+        updated_copy = copy.copy(self)
+        
+        for target_object, attribute_name, attribute_value in assignments:
+            if target_object is self:
+                object.__setattr__(updated_copy, attribute_name, attribute_value)
+        
+        return updated_copy
+    
+    def update_from_dict(self, patch_dict: dict, allow_unknown: Optional[bool] = None,
+                         add_unknown_as_is: Optional[bool] = None,
+                         allow_as_is_unknown_overloading: Optional[bool] = None,
+                         allow_missing_required: Optional[bool] = None, allow_missing_nullable: Optional[bool] = None,
+                         add_unserializable_as_dict: Optional[bool] = None, validate_type: Optional[bool] = None,
+                         parsing_depth: Optional[int] = None, do_deep_copy: Optional[bool] = None,
+                         options: Optional[DeserializeOptions] = None):
+        """
+        Applies a given partial dict onto the class in-place instead of deserializing a new one.
+        
+        Only the given fields are validated and modified, and existing nested 'ISerializable' classes are updated
+        recursively instead of being replaced when the patch contains a dict for them.
+        Every field is validated before any modification is made, an error will therefore leave the class untouched.
+        Nested frozen classes are replaced by an updated copy since they cannot be modified in-place.
+        
+        The individual options are kept for compatibility and override the ones in 'options' when they are not 'None',
+        their default values are the ones of the 'DeserializeOptions' class.
+        
+        :param patch_dict: Dictionary containing the fields to update.
+        :param allow_unknown: Allow unknown fields to be processed, other parameters will determine their use if 'True'.
+        :param add_unknown_as_is: Adds unknown fields/values as-is in the class if 'allow_unknown' is also 'True'.
+        :param allow_as_is_unknown_overloading: Allow unknown fields/values to overload existing class attributes.
+        :param allow_missing_required: ! Not used yet !
+        :param allow_missing_nullable: ! Not used yet !
+        :param add_unserializable_as_dict: ! Not used yet !
+        :param validate_type: Enables a strict type check between the class' serializable fields and the given data.
+        :param parsing_depth: The recursive depth to which the update process will go.  (-1 means infinite)
+        :param do_deep_copy: Performs a deep copy of the given 'patch_dict' values to prevent modifications from
+        affecting other variables that may reference them.
+        :param options: A 'DeserializeOptions' object, or one of its presets, containing all the options at once.
+        :raises TypeError: If a mismatch between the expected and received data's types is found, requires
+         'validate_type' to be set to 'True', or if the class itself is frozen.
+        :raises ValueError: If an unknown field is given and cannot be allowed or added back in the class.
+        """
+        
+        if type(self).__dataclass_params__.frozen:
+            raise TypeError("The frozen '{}' class cannot be updated in-place !".format(type(self).__name__))
+        
+        options = resolve_options(
+            options,
+            allow_unknown=allow_unknown,
+            add_unknown_as_is=add_unknown_as_is,
+            allow_as_is_unknown_overloading=allow_as_is_unknown_overloading,
+            allow_missing_required=allow_missing_required,
+            allow_missing_nullable=allow_missing_nullable,
+            add_unserializable_as_dict=add_unserializable_as_dict,
+            validate_type=validate_type,
+            parsing_depth=parsing_depth,
+            do_deep_copy=do_deep_copy,
+        )
+        
+        references = _ReferenceRegistry() if options.resolve_references else None
+        
+        for target_object, attribute_name, attribute_value in self._prepare_update(
+                patch_dict=patch_dict, options=options, parsing_depth=options.parsing_depth, references=references):
+            setattr(target_object, attribute_name, attribute_value)
+        
+        if references is not None:
+            references.resolve_pending_references(self)
+    
+    @classmethod
+    def _find_shared_instances(cls, value: Any, seen_instance_ids: set[int], shared_instance_ids: set[int]):
+        """
+        Walks through a given value and records the identity of every 'ISerializable' class that is reached more
+        than once.
+        
+        Already seen classes aren't walked through again, which prevents cycles from recursing forever.
+        
+        :param value: The value to walk through.
+        :param seen_instance_ids: The 'id' of every 'ISerializable' class reached so far.
+        :param shared_instance_ids: The 'id' of every 'ISerializable' class reached more than once.
+        """
+        
+        if isinstance(value, ISerializable):
+            if id(value) in seen_instance_ids:
+                shared_instance_ids.add(id(value))
+                return
+            
+            seen_instance_ids.add(id(value))
+            
+            for field_name in value._get_serializable_fields():
+                cls._find_shared_instances(getattr(value, field_name), seen_instance_ids, shared_instance_ids)
+        elif isinstance(value, (list, tuple, set)):
+            for element in value:
+                cls._find_shared_instances(element, seen_instance_ids, shared_instance_ids)
+        elif isinstance(value, dict):
+            for element in value.values():
+                cls._find_shared_instances(element, seen_instance_ids, shared_instance_ids)
+    
+    @classmethod
+    def _serialize_value(cls, value: Any, references: Optional["_SerializationReferences"] = None) -> Any:
+        """
+        Serializes a given value by converting any 'ISerializable' class it contains into a dict.
+        
+        :param value: The value to serialize.
+        :param references: The shared instances and their reference ids, only given if 'track_references' is used.
+        :return: The serialized value, iterables are always copied, and primitives are returned as-is.
+        """
+        
+        if isinstance(value, ISerializable):
+            if references is not None and id(value) in references.shared_instance_ids:
+                if id(value) in references.reference_ids:
+                    return {REFERENCE_KEY: references.reference_ids[id(value)]}
+                
+                # The id is assigned before the fields are serialized since they may reference the class itself.
+                reference_id = len(references.reference_ids)
+                references.reference_ids[id(value)] = reference_id
+                
+                return {REFERENCE_ID_KEY: reference_id, **value._serialize_fields(references)}
+            
+            return value._serialize_fields(references)
+        elif isinstance(value, list):
+            return [cls._serialize_value(element, references) for element in value]
+        elif isinstance(value, tuple):
+            return tuple([cls._serialize_value(element, references) for element in value])
+        elif isinstance(value, set):
+            return set([cls._serialize_value(element, references) for element in value])
+        elif isinstance(value, dict):
+            return {
+                element_key: cls._serialize_value(element_value, references)
+                for element_key, element_value in value.items()
+            }
+        
+        return value
+    
+    def _serialize_fields(self, references: Optional["_SerializationReferences"]) -> dict[str, Any]:
+        """
+        Serializes every serializable field of the class into a dict.
+        
+        :param references: The shared instances and their reference ids, only given if 'track_references' is used.
+        :return: A dictionary containing every serializable field, preceded by the class' tag if it has one.
+        """
+        
+        serialized_fields = {
+            field_name: self._serialize_value(getattr(self, field_name), references)
+            for field_name in self._get_serializable_fields()
+        }
+        
+        if self._discriminator_tag is not None and self._discriminator_key not in serialized_fields:
+            return {self._discriminator_key: self._discriminator_tag, **serialized_fields}
+        
+        return serialized_fields
+    
+    def to_dict(self, track_references: bool = False) -> dict[str, Any]:
+        """
+        Serializes the class into a dict that can be given back to 'from_dict'.
+        
+        Unknown fields added with 'add_unknown_as_is' are not serialized !
+        
+        If 'track_references' is used, any 'ISerializable' class reached more than once is only serialized the first
+        time with an additional '$id' key, and every later occurrence is replaced by a '{"$ref": <id>}' dict.
+        The 'resolve_references' option must then be used to deserialize the data.
+        
+        :param track_references: Serializes shared instances only once, which is required if the classes form a cycle.
+        :return: A dictionary containing every serializable field, with nested 'ISerializable' classes converted
+         into dictionaries.
+        """
+        
+        if not track_references:
+            return self._serialize_fields(None)
+        
+        shared_instance_ids: set[int] = set()
+        self._find_shared_instances(self, set(), shared_instance_ids)
+        
+        return self._serialize_value(self, _SerializationReferences(shared_instance_ids))
+    
+    def to_json(self, track_references: bool = False, **json_kwargs) -> str:
+        """
+        Serializes the class into a json-encoded dict.
+        
+        Tuples and sets are encoded as lists.
+        
+        :param track_references: Serializes shared instances only once, see 'to_dict' for more information.
+        :param json_kwargs: Parameters passed as-is to 'json.dumps'.
+        :return: The json string representing the class.
+        :raises TypeError: If a field contains a value that cannot be encoded in JSON.
+        """
+        
+        return json.dumps(self.to_dict(track_references=track_references), default=_encode_json_set, **json_kwargs)
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the class into a compact binary format that follows the order of its serializable fields.
+        
+        No field names are written, primitives are stored with a fixed width, strings and iterables are length-prefixed
+        and nested 'ISerializable' classes are written inline.
+        The data is prefixed by a fingerprint of the class' schema that is checked by 'from_bytes'.
+        
+        Unknown fields added with 'add_unknown_as_is' are not serialized !
+        
+        :return: The encoded bytes.
+        :raises TypeError: If a field's value doesn't match its type annotation, or if its type isn't supported.
+        :raises ValueError: If an 'int' field's value cannot be stored in 64 bits.
+        """
+        
+        from ._binary import dumps
+        
+        return dumps(self)
+    
+    @classmethod
+    def from_bytes(cls, data_bytes: Union[bytes, bytearray, memoryview]):
+        """
+        Deserialize some data encoded with 'to_bytes' into the relevant serializable class.
+        
+        Polymorphic classes can be decoded through any class of their hierarchy that they extend, like 'from_dict'.
+        
+        :param data_bytes: Bytes containing the data to deserialize.
+        :return: The parsed 'ISerializable' class.
+        :raises TypeError: If one of the class' fields has a type that isn't supported by the binary format, or if the
+         data contains a class that doesn't extend this one.
+        :raises ValueError: If the data is malformed, truncated, or was encoded from a class with a different schema.
+        """
+        
+        from ._binary import loads
+        
+        return loads(cls, data_bytes)
+
+
+class ITrackable(ISerializable):
+    """
+    Extension of the 'ISerializable' interface that can record which serializable fields are assigned in order to
+    only serialize the changes with 'to_delta_dict'.
+    
+    It is kept separate since it overrides '__setattr__', which slows down every assignment made to the class,
+    including the ones made by its '__init__' method, even when change tracking is disabled.
+    Nested classes must also implement it for their changes to be tracked.
+    """
+    
+    _changed_fields: Optional[set[str]] = None
+    """
+    Names of the serializable fields that were assigned since change tracking was enabled or last cleared.
+    Left as 'None' when change tracking is disabled, which is the default.
+    """
+    
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        
+        if self._changed_fields is not None and self._is_field_serializable(name):
+            self._changed_fields.add(name)
+            
+            # Making sure changes made later on in newly assigned nested classes are also tracked.
+            if isinstance(value, ITrackable) and not value.is_tracking_changes():
+                value.enable_change_tracking()
+    
+    def enable_change_tracking(self):
+        """
+        Starts recording which serializable fields are assigned in this class and in its nested 'ITrackable'
+        classes, and clears any change recorded previously.
+        
+        Changes made in-place inside iterables, such as 'list.append', are not detected !
+        """
+        
+        object.__setattr__(self, "_changed_fields", set())
+        
+        for field_name in self._get_serializable_fields():
+            field_value = getattr(self, field_name, None)
+            if isinstance(field_value, ITrackable):
+                field_value.enable_change_tracking()
+    
+    def disable_change_tracking(self):
+        """
+        Stops recording which serializable fields are assigned in this class and in its nested 'ITrackable' classes.
+        """
+        
+        object.__setattr__(self, "_changed_fields", None)
+        
+        for field_name in self._get_serializable_fields():
+            field_value = getattr(self, field_name, None)
+            if isinstance(field_value, ITrackable):
+                field_value.disable_change_tracking()
+    
+    def is_tracking_changes(self) -> bool:
+        """
+        Checks if the assignments of serializable fields are being recorded.
+        
+        :return: True if change tracking is enabled, False otherwise.
+        """
+        
+        return self._changed_fields is not None
+    
+    def get_changed_fields(self) -> set[str]:
+        """
+        Gets the names of the serializable fields of this class that were assigned since the last snapshot.
+        
+        Changes made in nested 'ITrackable' classes are not included, see 'to_delta_dict' for that.
+        
+        :return: A set containing the names of the changed fields.
+        :raises RuntimeError: If change tracking is not enabled.
+        """
+        
+        if self._changed_fields is None:
+            raise RuntimeError("Change tracking is not enabled on this '{}' class !".format(type(self).__name__))
+        
+        return set(self._changed_fields)
+    
+    def clear_changes(self):
+        """
+        Takes a snapshot of the class by forgetting every change recorded in it and in its nested 'ITrackable'
+        classes.
+        
+        :raises RuntimeError: If change tracking is not enabled.
+        """
+        
+        if self._changed_fields is None:
+            raise RuntimeError("Change tracking is not enabled on this '{}' class !".format(type(self).__name__))
+        
+        self._changed_fields.clear()
+        
+        for field_name in self._get_serializable_fields():
+            field_value = getattr(self, field_name, None)
+            if isinstance(field_value, ITrackable) and field_value.is_tracking_changes():
+                field_value.clear_changes()
+    
+    def to_delta_dict(self) -> dict[str, Any]:
+        """
+        Serializes only the fields that were assigned since the last snapshot into a dict.
+        
+        Assigned fields are serialized fully, while unchanged nested 'ITrackable' classes are only included through
+        their own delta if they contain any change.
+        The result can be applied onto another copy of the class with 'update_from_dict'.
+        
+        :return: A dictionary containing the changed fields and the deltas of nested classes.
+        :raises RuntimeError: If change tracking is not enabled.
+        """
+        
+        if self._changed_fields is None:
+            raise RuntimeError("Change tracking is not enabled on this '{}' class !".format(type(self).__name__))
+        
+        _delta_dict: dict[str, Any] = dict()
+        
+        for field_name in self._get_serializable_fields():
+            field_value = getattr(self, field_name)
+            
+            if field_name in self._changed_fields:
+                _delta_dict[field_name] = self._serialize_value(field_value)
+            elif isinstance(field_value, ITrackable) and field_value.is_tracking_changes():
+                nested_delta_dict = field_value.to_delta_dict()
+                if len(nested_delta_dict) > 0:
+                    _delta_dict[field_name] = nested_delta_dict
+        
+        return _delta_dict
+
+
+class _SerializationReferences:
+    """
+    State of a single 'to_dict' call that uses 'track_references'.
+    
+    Should not be used outside this module !
+    """
+    
+    def __init__(self, shared_instance_ids: set[int]):
+        self.shared_instance_ids = shared_instance_ids
+        """The 'id' of every 'ISerializable' class reached more than once."""
+        
+        self.reference_ids: dict[int, int] = dict()
+        """The reference id assigned to the shared classes that were already serialized, indexed by their 'id'."""
+
+
+class _PendingReference:
+    """
+    Placeholder used in place of a shared instance that is still being deserialized, which only happens with cycles.
+    
+    Should not be used outside this module !
+    """
+    
+    def __init__(self, reference_id: Any):
+        self.reference_id = reference_id
+
+
+class _ReferenceRegistry:
+    """
+    State of a single deserialization that uses 'resolve_references'.
+    
+    Should not be used outside this module !
+    """
+    
+    def __init__(self):
+        self._instances: dict[Any, Optional[ISerializable]] = dict()
+        """The deserialized shared instances indexed by their reference id, 'None' if still being deserialized."""
+        
+        self._instance_classes: dict[Any, type] = dict()
+        """The class of the shared instances indexed by their reference id."""
+        
+        self._has_pending_references = False
+    
+    def declare_instance(self, reference_id: Any, instance_class: type):
+        """
+        Records that the instance with the given reference id is being deserialized.
+        
+        :param reference_id: The value of the instance's '$id' key.
+        :param instance_class: The 'ISerializable' class being deserialized.
+        :raises ValueError: If the reference id was already declared.
+        """
+        
+        if reference_id in self._instances:
+            raise ValueError("The '{}' reference id is declared more than once !".format(reference_id))
+        
+        self._instances[reference_id] = None
+        self._instance_classes[reference_id] = instance_class
+    
+    def register_instance(self, reference_id: Any, instance: ISerializable):
+        """
+        Records the deserialized instance for a given reference id.
+        
+        :param reference_id: The value of the instance's '$id' key.
+        :param instance: The deserialized instance.
+        """
+        
+        self._instances[reference_id] = instance
+    
+    def get_instance(self, reference_id: Any, expected_class: type) -> Any:
+        """
+        Gets the instance referenced by a given reference id.
+        
+        :param reference_id: The value of the '$ref' key.
+        :param expected_class: The 'ISerializable' class the instance is expected to be.
+        :return: The referenced instance, or a placeholder if it is still being deserialized.
+        :raises ValueError: If the reference id wasn't declared before.
+        :raises TypeError: If the referenced instance isn't of the expected class.
+        """
+        
+        if reference_id not in self._instances:
+            raise ValueError("The '{}' reference id is used before being declared !".format(reference_id))
+        
+        if not issubclass(self._instance_classes[reference_id], expected_class):
+            raise TypeError("The '{}' reference id points to a '{}' instead of a '{}' !".format(
+                reference_id, self._instance_classes[reference_id].__name__, expected_class.__name__))
+        
+        instance = self._instances[reference_id]
+        
+        if instance is None:
+            self._has_pending_references = True
+            return _PendingReference(reference_id)
+        
+        return instance
+    
+    def resolve_pending_references(self, root_value: Any) -> Any:
+        """
+        Replaces every placeholder left in a given deserialized value by the instance it references.
+        
+        :param root_value: The deserialized value.
+        :return: The given value, or the referenced instance if it was a placeholder itself.
+        """
+        
+        if not self._has_pending_references:
+            return root_value
+        
+        return self._resolve_value(root_value, set())
+    
+    def _resolve_value(self, value: Any, visited_instance_ids: set[int]) -> Any:
+        if isinstance(value, _PendingReference):
+            return self._instances[value.reference_id]
+        elif isinstance(value, ISerializable):
+            if id(value) not in visited_instance_ids:
+                visited_instance_ids.add(id(value))
+                
+                for field_name in value._get_serializable_fields():
+                    field_value = getattr(value, field_name)
+                    resolved_value = self._resolve_value(field_value, visited_instance_ids)
+                    
+                    if resolved_value is not field_value:
+                        # Bypassing '__setattr__' since restoring a cycle isn't a change, and for frozen classes.
+                        object.__setattr__(value, field_name, resolved_value)
+        elif isinstance(value, list):
+            for element_index, element in enumerate(value):
+                value[element_index] = self._resolve_value(element, visited_instance_ids)
+        elif isinstance(value, dict):
+            for element_key, element_value in value.items():
+                value[element_key] = self._resolve_value(element_value, visited_instance_ids)
+        
+        return value
 
 
 class IDeserializable(ABC):
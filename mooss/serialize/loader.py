@@ -0,0 +1,112 @@
+# Imports
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import glob
+import os
+from typing import Union, Iterable, Optional, Any
+
+from .compression import read_compressed
+from .interface import ISerializable
+
+
+# Constants
+DEFAULT_MAX_WORKERS = 16
+"""
+Default amount of threads used to read and deserialize files concurrently.
+"""
+
+
+# Classes
+@dataclass
+class FilesLoadResult:
+    """
+    Result of a multi-file load containing the deserialized classes and the errors, both indexed by their file's path.
+    """
+    
+    instances: dict[str, Any] = field(default_factory=dict)
+    """Deserialized 'ISerializable' classes indexed by the path of the file they were read from."""
+    
+    errors: dict[str, Exception] = field(default_factory=dict)
+    """Exceptions raised while reading or deserializing a file, indexed by the path of the relevant file."""
+    
+    def has_errors(self) -> bool:
+        """
+        Checks if any file failed to be read or deserialized.
+        
+        :return: True if at least one error was encountered, False otherwise.
+        """
+        
+        return len(self.errors) > 0
+
+
+# Functions
+def _resolve_paths(paths: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]]) -> list[str]:
+    """
+    Resolves the given glob pattern or list of paths into a list of file paths without any duplicates.
+    """
+    
+    if isinstance(paths, (str, os.PathLike)):
+        return sorted(glob.glob(os.fspath(paths), recursive=True))
+    
+    return list(dict.fromkeys([os.fspath(path) for path in paths]))
+
+
+def _load_json_file(serializable_class: type, file_path: str, encoding: str,
+                    from_json_kwargs: dict[str, Any]) -> tuple[Optional[Any], Optional[Exception]]:
+    """
+    Reads and deserializes a single file while catching any exception it may raise.
+    """
+    
+    try:
+        data_json = read_compressed(file_path).decode(encoding)
+        return serializable_class.from_json(data_json=data_json, **from_json_kwargs), None
+    except Exception as err:
+        return None, err
+
+
+def load_json_files(serializable_class: type, paths: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]],
+                    max_workers: int = DEFAULT_MAX_WORKERS, encoding: str = "utf-8",
+                    **from_json_kwargs) -> FilesLoadResult:
+    """
+    Reads and deserializes many JSON files concurrently into the given 'ISerializable' class.
+    
+    Files are opened and read in a bounded thread pool since these operations release the GIL and can overlap,
+    which is especially useful on network-backed volumes.
+    Compressed files are decompressed on the fly, their codec is detected through their extension or first bytes.
+    An error in one file doesn't prevent the other files from being loaded, it is reported in the result instead.
+    
+    :param serializable_class: The 'ISerializable' class into which every file will be deserialized.
+    :param paths: A glob pattern, which supports '**', or an iterable of file paths.
+    :param max_workers: The maximum amount of threads used to load the files.
+    :param encoding: The text encoding of the files.
+    :param from_json_kwargs: Parameters passed as-is to 'from_json' for every file.
+    :return: A 'FilesLoadResult' object containing the deserialized classes and the errors in the order of the paths.
+    :raises TypeError: If the given class doesn't implement 'ISerializable'.
+    :raises ValueError: If 'max_workers' is lower than 1.
+    """
+    
+    if not (isinstance(serializable_class, type) and issubclass(serializable_class, ISerializable)):
+        raise TypeError("The '{}' class doesn't implement 'ISerializable' !".format(serializable_class))
+    
+    if max_workers < 1:
+        raise ValueError("At least one worker is required to load files !")
+    
+    file_paths = _resolve_paths(paths)
+    load_result = FilesLoadResult()
+    
+    if len(file_paths) == 0:
+        return load_result
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+        file_results = executor.map(
+            lambda file_path: _load_json_file(serializable_class, file_path, encoding, from_json_kwargs),
+            file_paths
+        )
+        
+        for file_path, (instance, error) in zip(file_paths, file_results):
+            if error is None:
+                load_result.instances[file_path] = instance
+            else:
+                load_result.errors[file_path] = error
+    
+    return load_result
@@ -0,0 +1,165 @@
+# Imports
+from dataclasses import dataclass, fields, replace
+from enum import IntEnum, auto
+from typing import Optional
+
+
+# Enumerations
+class EListValidation(IntEnum):
+    """
+    Enumeration of the policies used to validate the type of the elements of 'list[...]' fields.
+    """
+    
+    LIST_VALIDATION_FULL = auto()
+    """Validates every element, the cost of the validation grows with the length of the lists."""
+    
+    LIST_VALIDATION_FIRST = auto()
+    """Only validates the first 'list_validation_count' elements."""
+    
+    LIST_VALIDATION_SAMPLE = auto()
+    """Validates 'list_validation_count' elements picked at random."""
+    
+    LIST_VALIDATION_OFF = auto()
+    """Doesn't validate any element."""
+
+
+# Constants
+LIST_VALIDATION_METADATA_KEY = "list_validation"
+"""
+Key of a field's metadata that can contain an 'EListValidation' policy that overrides the one of the options.
+"""
+
+LIST_VALIDATION_COUNT_METADATA_KEY = "list_validation_count"
+"""
+Key of a field's metadata that can contain an amount of elements that overrides the one of the options.
+"""
+
+
+# Classes
+@dataclass(frozen=True)
+class DeserializeOptions:
+    """
+    Immutable and hashable set of options that influence the way 'ISerializable' classes are deserialized.
+    
+    The same object is passed down unchanged to nested classes, which allows it to be used as a cache key alongside
+    the deserialized class.
+    Its hash is computed once and cached since it is used by every cache lookup made while deserializing.
+    """
+    
+    allow_unknown: bool = False
+    """Allow unknown fields to be processed, other options will determine their use if 'True'."""
+    
+    add_unknown_as_is: bool = False
+    """Adds unknown fields/values as-is in the final class if 'allow_unknown' is also 'True'."""
+    
+    allow_as_is_unknown_overloading: bool = False
+    """Allow unknown fields/values to overload existing class attributes."""
+    
+    allow_missing_required: bool = False
+    """! Not used yet !"""
+    
+    allow_missing_nullable: bool = True
+    """! Not used yet !"""
+    
+    add_unserializable_as_dict: bool = False
+    """! Not used yet !"""
+    
+    validate_type: bool = True
+    """Enables a strict type check between the class' serializable fields and the given data."""
+    
+    parsing_depth: int = -1
+    """The recursive depth to which the deserialization process will go.  (-1 means infinite)"""
+    
+    do_deep_copy: bool = False
+    """
+    Performs a deep copy of the given data to prevent modifications from affecting other variables that may
+    reference it.
+    """
+    
+    list_validation: EListValidation = EListValidation.LIST_VALIDATION_FIRST
+    """
+    Policy used to validate the type of the elements of 'list[...]' fields if 'validate_type' is also 'True'.
+    Can be overridden for a specific field through its metadata with the 'list_validation' key.
+    Lists whose first element has the wrong type are refused by default, which wasn't the case before this option
+    was added, 'LIST_VALIDATION_OFF' restores that behaviour.
+    """
+    
+    list_validation_count: int = 1
+    """
+    Amount of elements validated by the 'LIST_VALIDATION_FIRST' and 'LIST_VALIDATION_SAMPLE' policies.
+    Can be overridden for a specific field through its metadata with the 'list_validation_count' key.
+    """
+    
+    resolve_references: bool = False
+    """
+    Resolves the '$id' and '$ref' markers emitted by 'to_dict' when 'track_references' is used so that shared
+    instances, and cycles, are restored as a single instance.
+    """
+    
+    def __hash__(self) -> int:
+        options_hash = self.__dict__.get("_options_hash")
+        
+        if options_hash is None:
+            options_hash = hash(tuple(getattr(self, options_field.name) for options_field in fields(self)))
+            object.__setattr__(self, "_options_hash", options_hash)
+        
+        return options_hash
+    
+    def replace(self, **changes) -> "DeserializeOptions":
+        """
+        Creates a copy of these options with some of their values changed.
+        
+        :param changes: Names and new values of the options to change.
+        :return: The new 'DeserializeOptions' object.
+        :raises TypeError: If an unknown option is given.
+        """
+        
+        return replace(self, **changes)
+
+
+# Presets
+DEFAULT = DeserializeOptions()
+"""
+Options used when none are given, matches the default values of the parameters of 'from_dict'.
+"""
+
+STRICT = DeserializeOptions(allow_missing_nullable=False, do_deep_copy=True,
+                            list_validation=EListValidation.LIST_VALIDATION_FULL)
+"""
+Rejects unknown fields, validates every type, including every element of lists, and copies the given data deeply so
+that it is never shared.
+"""
+
+LENIENT = DeserializeOptions(allow_unknown=True, allow_missing_required=True)
+"""
+Silently ignores unknown fields while still validating the types of the known ones.
+"""
+
+TRUSTED = DeserializeOptions(allow_unknown=True, validate_type=False,
+                             list_validation=EListValidation.LIST_VALIDATION_OFF)
+"""
+Skips type validation and ignores unknown fields, should only be used with data coming from trusted producers.
+"""
+
+
+# Functions
+def resolve_options(options: Optional[DeserializeOptions] = None, **legacy_options) -> DeserializeOptions:
+    """
+    Merges the given options with the individual options given as keyword parameters to the deserialization methods.
+    
+    :param options: The base options, 'DEFAULT' is used if 'None'.
+    :param legacy_options: Individual options that override the base ones, they are ignored if 'None'.
+    :return: The given options object if no individual option was overridden, a modified copy otherwise.
+    """
+    
+    if options is None:
+        options = DEFAULT
+    
+    overridden_options = {
+        option_name: option_value for option_name, option_value in legacy_options.items() if option_value is not None
+    }
+    
+    if len(overridden_options) == 0:
+        return options
+    
+    return options.replace(**overridden_options)
@@ -0,0 +1,180 @@
+# Imports
+import codecs
+import json
+import os
+from typing import Union, Optional, Iterator, IO, Any
+
+from .interface import ISerializable
+from .options import DeserializeOptions
+
+
+# Constants
+DEFAULT_CHUNK_SIZE = 64 * 1024
+"""
+Default amount of characters or bytes read at once from the streams.
+"""
+
+_JSON_WHITESPACES = " \t\n\r"
+
+_JSON_MAX_TOKEN_SIZE = len("-Infinity")
+"""
+Length of the longest token that isn't a string, an error closer than this to the end of the buffer may have been
+caused by a token that was cut between two chunks.
+"""
+
+
+# Classes
+class _JsonArrayReader:
+    """
+    Incremental reader that yields the elements of a top-level JSON array one at a time by using
+    'JSONDecoder.raw_decode' over a sliding buffer.
+    
+    Should not be used outside this module !
+    """
+    
+    def __init__(self, stream: IO, chunk_size: int, encoding: str):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._byte_decoder = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ""
+        self._position = 0
+        self._is_eof = False
+    
+    def _read_more(self, minimum_size: int = 0) -> bool:
+        """
+        Reads at least one more chunk from the stream and discards the part of the buffer that was already consumed.
+        
+        :param minimum_size: Minimum amount of characters or bytes to read.
+        :return: True if some data was read, False if the end of the stream was reached.
+        """
+        
+        if self._is_eof:
+            return False
+        
+        self._buffer = self._buffer[self._position:]
+        self._position = 0
+        
+        while True:
+            raw_chunk = self._stream.read(max(self._chunk_size, minimum_size))
+            
+            # Bytes are decoded incrementally since a multibyte character may be split between two chunks.
+            chunk = self._byte_decoder.decode(raw_chunk, final=len(raw_chunk) == 0) \
+                if isinstance(raw_chunk, bytes) else raw_chunk
+            
+            if len(raw_chunk) == 0:
+                self._is_eof = True
+                self._buffer += chunk
+                return len(chunk) > 0
+            
+            if len(chunk) > 0:
+                self._buffer += chunk
+                return True
+    
+    def _skip_whitespaces(self) -> Optional[str]:
+        """
+        Skips any whitespace and returns the next character without consuming it.
+        
+        :return: The next character, or None if the end of the stream was reached.
+        """
+        
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _JSON_WHITESPACES:
+                self._position += 1
+            
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            
+            if not self._read_more():
+                return None
+    
+    def _decode_element(self) -> Any:
+        """
+        Decodes the element starting after the current position, reading more data until it is complete.
+        """
+        
+        self._skip_whitespaces()
+        
+        while True:
+            try:
+                element, end_position = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as err:
+                # Only errors caused by the end of the buffer can be fixed by reading more data.
+                if err.pos < len(self._buffer) - _JSON_MAX_TOKEN_SIZE and \
+                        not err.msg.startswith("Unterminated string"):
+                    raise
+                
+                # Doubling the buffer at each attempt to keep the cost of retrying large elements linear.
+                if not self._read_more(minimum_size=len(self._buffer) - self._position):
+                    raise
+                continue
+            
+            # Numbers and literals that end with the buffer may have been cut and need to be decoded again.
+            if end_position == len(self._buffer) and self._read_more():
+                continue
+            
+            self._position = end_position
+            return element
+    
+    def __iter__(self) -> Iterator[Any]:
+        if self._skip_whitespaces() != "[":
+            raise ValueError("The given stream doesn't contain a top-level JSON array !")
+        self._position += 1
+        
+        if self._skip_whitespaces() == "]":
+            self._position += 1
+        else:
+            while True:
+                yield self._decode_element()
+                
+                next_character = self._skip_whitespaces()
+                self._position += 1
+                
+                if next_character == "]":
+                    break
+                elif next_character != ",":
+                    raise ValueError("Expected ',' or ']' after an element of the JSON array, got '{}' !".format(
+                        next_character))
+        
+        if self._skip_whitespaces() is not None:
+            raise ValueError("Unexpected data found after the end of the JSON array !")
+
+
+# Functions
+def iter_json_array(serializable_class: type, source: Union[str, os.PathLike, IO],
+                    options: Optional[DeserializeOptions] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Reads a top-level JSON array incrementally and yields each of its elements deserialized with 'from_dict'.
+    
+    The whole array is never loaded at once, the memory usage is bounded by the size of the largest element and
+    of the read chunks.
+    
+    :param serializable_class: The 'ISerializable' class into which every element will be deserialized.
+    :param source: The path of the file to read, or a text or binary stream.
+    :param options: The options given to 'from_dict' for every element.
+    :param chunk_size: Amount of characters or bytes read at once from the stream.
+    :param encoding: The text encoding of the data, only used with files and binary streams.
+    :return: An iterator of deserialized 'ISerializable' classes.
+    :raises TypeError: If the given class doesn't implement 'ISerializable', or if an element is not a JSON object.
+    :raises ValueError: If the data isn't a properly formatted JSON array.
+    :raises JSONDecodeError: If an element is not properly formatted.
+    """
+    
+    if not (isinstance(serializable_class, type) and issubclass(serializable_class, ISerializable)):
+        raise TypeError("The '{}' class doesn't implement 'ISerializable' !".format(serializable_class))
+    
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be greater than 0 !")
+    
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            yield from iter_json_array(serializable_class, stream, options, chunk_size, encoding)
+        return
+    
+    for element_index, element in enumerate(_JsonArrayReader(source, chunk_size, encoding)):
+        if not isinstance(element, dict):
+            raise TypeError("The element #{} of the JSON array is a '{}' instead of an object !".format(
+                element_index, type(element).__name__))
+        
+        yield serializable_class.from_dict(data_dict=element, options=options)
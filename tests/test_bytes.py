@@ -0,0 +1,117 @@
+# Imports
+from dataclasses import dataclass
+from typing import Union, Any, Optional
+import unittest
+
+from mooss.serialize.interface import ISerializable
+
+
+# Classes
+@dataclass
+class TestedNestedClass(ISerializable):
+    field_int: int
+    field_optional_str: Optional[str]
+
+
+@dataclass
+class TestedRootClass(ISerializable):
+    field_int: int
+    field_bool: bool
+    field_float: float
+    field_str: str
+    field_list_int: list[int]
+    field_dict_str_float: dict[str, float]
+    field_tuple: tuple[int, str]
+    field_union: Union[TestedNestedClass, str, None]
+    field_list_nested: list[TestedNestedClass]
+    field_any: Any
+    field_raw_list: list
+
+
+@dataclass
+class TestedNestedSubClass(TestedNestedClass):
+    field_extra: str
+
+
+@dataclass
+class TestedAnyClass(ISerializable):
+    field_any: Any
+
+
+@dataclass
+class TestedOtherClass(ISerializable):
+    field_int: int
+    field_optional_str: Optional[int]
+
+
+# Unit tests
+class TestBytesMethods(unittest.TestCase):
+    def test_round_trip(self):
+        """
+        Testing if classes encoded with 'to_bytes' are properly decoded by 'from_bytes'.
+        """
+        
+        print("Testing the binary round-trip...")
+        data = {
+            "field_int": -42,
+            "field_bool": True,
+            "field_float": 2.5,
+            "field_str": "Hello world ! éà",
+            "field_list_int": [1, 2, 3],
+            "field_dict_str_float": {"a": 1.0, "b": -0.5},
+            "field_tuple": (13, "abc"),
+            "field_union": "text",
+            "field_list_nested": [],
+            "field_any": {"key": [1, "two", None, 3.0, False]},
+            "field_raw_list": ["abc", 123],
+        }
+        
+        print("> Preparing classes...")
+        original_class: TestedRootClass = TestedRootClass.from_dict(data_dict=data)
+        original_class.field_union = TestedNestedClass(120, None)
+        original_class.field_list_nested = [TestedNestedClass(1, "a"), TestedNestedClass(2, None)]
+        decoded_class: TestedRootClass = TestedRootClass.from_bytes(original_class.to_bytes())
+        
+        print("> Checking the decoded class...")
+        self.assertEqual(original_class, decoded_class)
+        self.assertEqual(TestedNestedClass, type(decoded_class.field_union))
+        self.assertEqual(tuple, type(decoded_class.field_tuple))
+        self.assertEqual(bool, type(decoded_class.field_any["key"][4]))
+        
+        print("> Checking the union's other members...")
+        for union_value in ["text", None]:
+            original_class.field_union = union_value
+            self.assertEqual(original_class, TestedRootClass.from_bytes(original_class.to_bytes()))
+    
+    def test_invalid(self):
+        """
+        Testing if invalid values and payloads are properly rejected.
+        """
+        
+        print("Testing mismatched values...")
+        self.assertRaises(TypeError, lambda: TestedNestedClass(field_int="abc", field_optional_str=None).to_bytes())
+        self.assertRaises(TypeError, lambda: TestedNestedClass(field_int=True, field_optional_str=None).to_bytes())
+        self.assertRaises(ValueError, lambda: TestedNestedClass(field_int=2 ** 64, field_optional_str=None).to_bytes())
+        
+        print("Testing subclasses whose additional fields would be lost...")
+        self.assertRaises(TypeError, lambda: TestedRootClass(
+            1, True, 1.0, "a", [], {}, (1, "a"), TestedNestedSubClass(1, None, "lost"), [], None, []).to_bytes())
+        
+        print("Testing mismatched schemas...")
+        encoded_data = TestedNestedClass(field_int=1, field_optional_str="abc").to_bytes()
+        self.assertEqual(TestedNestedClass(1, "abc"), TestedNestedClass.from_bytes(encoded_data))
+        self.assertRaises(ValueError, lambda: TestedOtherClass.from_bytes(encoded_data))
+        
+        print("Testing malformed payloads...")
+        for truncated_size in range(1, 5):
+            self.assertRaisesRegex(ValueError, "truncated", lambda: TestedNestedClass.from_bytes(
+                encoded_data[:-truncated_size]))
+        any_data = TestedAnyClass(["abc", 1]).to_bytes()
+        self.assertRaisesRegex(ValueError, "truncated", lambda: TestedAnyClass.from_bytes(any_data[:-9]))
+        self.assertRaises(ValueError, lambda: TestedNestedClass.from_bytes(encoded_data + b"\x00"))
+        self.assertRaises(ValueError, lambda: TestedNestedClass.from_bytes(b"\x00" + encoded_data[1:]))
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+# Imports
+from dataclasses import dataclass
+from typing import Optional
+import unittest
+
+from mooss.serialize.cache import LRUCache, json_payload_cache
+from mooss.serialize.interface import ISerializable, _data_shapes
+from mooss.serialize.options import DEFAULT, DeserializeOptions
+
+
+# Classes
+@dataclass
+class TestedClass(ISerializable):
+    field_int: int
+    field_str: str = "default"
+
+
+@dataclass(frozen=True)
+class TestedFrozenClass(ISerializable):
+    field_int: int
+    field_list: list[int]
+
+
+@dataclass
+class TestedContainerClass(ISerializable):
+    field_list_nested: list[TestedClass]
+    field_dict: dict
+    field_nested: Optional["TestedContainerClass"] = None
+
+
+@dataclass(frozen=True)
+class TestedImmutableClass(ISerializable):
+    field_int: int
+    field_nested: Optional[TestedFrozenClass] = None
+
+
+# Unit tests
+class TestCache(unittest.TestCase):
+    def test_lru_cache(self):
+        """
+        Testing if the 'LRUCache' class properly evicts its least recently used entries and counts its lookups.
+        """
+        
+        print("Testing the LRU eviction...")
+        cache = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.put("c", 3)
+        self.assertTrue("a" in cache)
+        self.assertFalse("b" in cache)
+        self.assertTrue("c" in cache)
+        self.assertIsNone(cache.get("b"))
+        
+        print("Testing the stats...")
+        self.assertEqual({"size": 2, "max_size": 2, "hits": 1, "misses": 1, "evictions": 1}, cache.get_stats())
+        
+        print("Testing the resizing and disabling of the cache...")
+        cache.max_size = 0
+        cache.put("d", 4)
+        self.assertEqual(0, len(cache))
+        cache.clear()
+        self.assertEqual(0, cache.hits)
+    
+    def test_shape_cache(self):
+        """
+        Testing if repeated input layouts reuse the cached shape without changing the deserialized results.
+        """
+        
+        print("Testing repeated layouts...")
+        _data_shapes.pop(TestedClass, None)
+        for i in range(3):
+            self.assertEqual(TestedClass(i, "default"), TestedClass.from_dict({"field_int": i}))
+            self.assertEqual(TestedClass(i, "abc"), TestedClass.from_dict({"field_str": "abc", "field_int": i}))
+        self.assertEqual(2, len(_data_shapes[TestedClass]))
+        self.assertIs(TestedClass._get_data_shape(["field_int"], DEFAULT),
+                      TestedClass._get_data_shape(("field_int",), DEFAULT))
+        
+        print("Testing if options are part of the key...")
+        data = {"field_int": 1, "unknown": 2}
+        self.assertRaises(ValueError, lambda: TestedClass.from_dict(data))
+        self.assertFalse(hasattr(TestedClass.from_dict(data, allow_unknown=True), "unknown"))
+        self.assertEqual(2, getattr(TestedClass.from_dict(data, allow_unknown=True, add_unknown_as_is=True), "unknown"))
+        self.assertRaises(ValueError, lambda: TestedClass.from_dict(data))
+        
+        print("Testing if missing required fields are still reported...")
+        self.assertRaises(ValueError, lambda: TestedClass.from_dict({"field_str": "abc"}))
+        self.assertRaises(ValueError, lambda: TestedClass.from_dict({"field_str": "abc"}))
+    
+    def test_json_payload_cache(self):
+        """
+        Testing if identical JSON payloads reuse the cached classes without sharing mutable ones.
+        """
+        
+        json_payload_cache.clear()
+        data_json = '{"field_int": 1, "field_str": "abc"}'
+        
+        print("Testing mutable classes...")
+        first_class = TestedClass.from_json(data_json, use_payload_cache=True)
+        second_class = TestedClass.from_json(data_json, use_payload_cache=True)
+        self.assertEqual(TestedClass(1, "abc"), second_class)
+        self.assertIsNot(first_class, second_class)
+        first_class.field_int = 2
+        self.assertEqual(1, TestedClass.from_json(data_json, use_payload_cache=True).field_int)
+        self.assertEqual(2, json_payload_cache.hits)
+        
+        print("Testing deeply immutable classes...")
+        data_json = '{"field_int": 1, "field_nested": null}'
+        first_class = TestedImmutableClass.from_json(data_json, use_payload_cache=True)
+        self.assertIs(first_class, TestedImmutableClass.from_json(data_json, use_payload_cache=True))
+        self.assertIs(first_class, TestedImmutableClass.from_json(data_json.encode("utf-8"), use_payload_cache=True))
+        
+        print("Testing frozen classes with mutable values...")
+        data_json = '{"field_int": 1, "field_list": [1, 2]}'
+        first_class = TestedFrozenClass.from_json(data_json, use_payload_cache=True)
+        first_class.field_list.append(3)
+        self.assertEqual([1, 2], TestedFrozenClass.from_json(data_json, use_payload_cache=True).field_list)
+        nested_json = '{"field_int": 1, "field_nested": {"field_int": 2, "field_list": []}}'
+        TestedImmutableClass.from_json(nested_json, use_payload_cache=True).field_nested.field_list.append(1)
+        nested_class = TestedImmutableClass.from_json(nested_json, use_payload_cache=True)
+        self.assertEqual([], nested_class.field_nested.field_list)
+        
+        print("Testing if the class and options are part of the key...")
+        self.assertIsNot(first_class, TestedFrozenClass.from_json(data_json, use_payload_cache=True,
+                                                                  validate_type=False))
+        self.assertRaises(ValueError, lambda: TestedClass.from_json(data_json, use_payload_cache=True))
+        self.assertEqual({"size": 5, "max_size": 256, "hits": 6, "misses": 6, "evictions": 0},
+                         json_payload_cache.get_stats())
+        
+        print("Testing if the cache is only used when asked...")
+        self.assertIsNot(first_class, TestedFrozenClass.from_json(data_json))
+        self.assertEqual(6, json_payload_cache.hits)
+    
+    
+    def test_json_payload_cache_copies(self):
+        """
+        Testing if the copies returned by the payload cache don't share any container or class with the cached one.
+        """
+        
+        print("Testing nested containers and classes...")
+        data_json = '{"field_list_nested": [{"field_int": 1, "field_str": "a"}], "field_dict": {"key": [1, 2]}}'
+        first_class = TestedContainerClass.from_json(data_json, use_payload_cache=True)
+        first_class.field_list_nested[0].field_int = 2
+        first_class.field_list_nested.append(TestedClass(3))
+        first_class.field_dict["key"].append(3)
+        self.assertEqual(TestedContainerClass([TestedClass(1, "a")], {"key": [1, 2]}),
+                         TestedContainerClass.from_json(data_json, use_payload_cache=True))
+        
+        print("Testing shared instances and cycles...")
+        data_json = '{"$id": 0, "field_list_nested": [], "field_dict": {}, "field_nested": {"$ref": 0}}'
+        options = DeserializeOptions(resolve_references=True)
+        TestedContainerClass.from_json(data_json, options=options, use_payload_cache=True)
+        copied_class = TestedContainerClass.from_json(data_json, options=options, use_payload_cache=True)
+        self.assertIs(copied_class, copied_class.field_nested)
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
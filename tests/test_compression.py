@@ -0,0 +1,132 @@
+# Imports
+from dataclasses import dataclass
+import gzip
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from mooss.serialize.compression import ECompressionCodec, CompressedIOStats, detect_codec, open_compressed, \
+    read_compressed, iter_json_array_file, iter_jsonl_file, write_json_array_file, write_jsonl_file
+from mooss.serialize.interface import ISerializable
+from mooss.serialize.loader import load_json_files
+
+
+# Classes
+@dataclass
+class TestedClass(ISerializable):
+    field_int: int
+    field_str: str
+
+
+# Unit tests
+class TestCompression(unittest.TestCase):
+    def test_round_trip(self):
+        """
+        Testing if classes written with every codec are properly read back and if statistics are gathered.
+        """
+        
+        expected_classes = [TestedClass(i, "Hello world ! éà" * (i % 7)) for i in range(500)]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for file_extension, expected_codec in [("", ECompressionCodec.CODEC_NONE),
+                                                   (".gz", ECompressionCodec.CODEC_GZIP),
+                                                   (".bz2", ECompressionCodec.CODEC_BZ2),
+                                                   (".xz", ECompressionCodec.CODEC_LZMA)]:
+                print("Testing the '{}' codec...".format(expected_codec.name))
+                
+                jsonl_path = os.path.join(temp_dir, "data.jsonl" + file_extension)
+                write_stats = write_jsonl_file(iter(expected_classes), jsonl_path)
+                self.assertEqual(expected_codec, write_stats.codec)
+                self.assertEqual(500, write_stats.elements)
+                self.assertEqual(os.path.getsize(jsonl_path), write_stats.compressed_bytes)
+                
+                read_stats = CompressedIOStats()
+                self.assertEqual(expected_classes, list(iter_jsonl_file(TestedClass, jsonl_path, stats=read_stats)))
+                self.assertEqual(write_stats.uncompressed_bytes, read_stats.uncompressed_bytes)
+                self.assertEqual(500, read_stats.elements)
+                self.assertGreater(read_stats.get_throughput(), 0)
+                
+                array_path = os.path.join(temp_dir, "data.json" + file_extension)
+                write_json_array_file(expected_classes, array_path, compression_level=1)
+                self.assertEqual(expected_classes, list(iter_json_array_file(TestedClass, array_path,
+                                                                             chunk_size=100)))
+                with open_compressed(array_path) as file:
+                    self.assertEqual(500, len(json.loads(file.read())))
+                self.assertEqual(500, len(json.loads(read_compressed(array_path))))
+    
+    def test_elapsed_time(self):
+        """
+        Testing if the time spent by the consumer and producer of the classes isn't included in the statistics.
+        """
+        
+        def produce_classes():
+            for i in range(5):
+                time.sleep(0.02)
+                yield TestedClass(i, "abc")
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            print("Testing the writers...")
+            jsonl_path = os.path.join(temp_dir, "data.jsonl")
+            array_path = os.path.join(temp_dir, "data.json")
+            self.assertLess(write_jsonl_file(produce_classes(), jsonl_path).elapsed_seconds, 0.05)
+            self.assertLess(write_json_array_file(produce_classes(), array_path).elapsed_seconds, 0.05)
+            
+            print("Testing the readers...")
+            for iter_file, file_path in [(iter_jsonl_file, jsonl_path), (iter_json_array_file, array_path)]:
+                read_stats = CompressedIOStats()
+                for _ in iter_file(TestedClass, file_path, stats=read_stats):
+                    time.sleep(0.02)
+                self.assertEqual(5, read_stats.elements)
+                self.assertLess(read_stats.elapsed_seconds, 0.05)
+    
+    def test_detection(self):
+        """
+        Testing if codecs are detected from the extensions and first bytes of files.
+        """
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            print("Testing the detection through the first bytes...")
+            file_path = os.path.join(temp_dir, "data.json")
+            with gzip.open(file_path, "wb") as file:
+                file.write(b'{"field_int": 1, "field_str": "abc"}')
+            self.assertEqual(ECompressionCodec.CODEC_GZIP, detect_codec(file_path))
+            self.assertEqual(ECompressionCodec.CODEC_NONE, detect_codec(file_path, check_magic_bytes=False))
+            self.assertEqual(b'{"field_int": 1, "field_str": "abc"}', read_compressed(file_path))
+            
+            print("Testing if the loader handles compressed files...")
+            load_result = load_json_files(TestedClass, [file_path])
+            self.assertEqual(TestedClass(1, "abc"), load_result.instances[file_path])
+            
+            print("Testing if the readers detect the codec from the opened file...")
+            for expected_codec in [ECompressionCodec.CODEC_BZ2, ECompressionCodec.CODEC_NONE]:
+                jsonl_path = os.path.join(temp_dir, "data_{}".format(expected_codec.name))
+                write_jsonl_file([TestedClass(1, "abc")], jsonl_path, codec=expected_codec)
+                read_stats = CompressedIOStats()
+                with mock.patch("builtins.open", wraps=open) as mocked_open:
+                    self.assertEqual([TestedClass(1, "abc")], list(iter_jsonl_file(TestedClass, jsonl_path,
+                                                                                   stats=read_stats)))
+                self.assertEqual(expected_codec, read_stats.codec)
+                self.assertEqual(1, mocked_open.call_count)
+        
+        print("Testing other encodings...")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "data.jsonl")
+            write_jsonl_file([TestedClass(1, "éà")], file_path, encoding="latin-1")
+            self.assertEqual([TestedClass(1, "éà")], list(iter_jsonl_file(TestedClass, file_path,
+                                                                            encoding="latin-1")))
+            
+            file_path = os.path.join(temp_dir, "data.json")
+            write_json_array_file([TestedClass(1, "éà"), TestedClass(2, "b")], file_path, encoding="utf-16")
+            self.assertEqual([TestedClass(1, "éà"), TestedClass(2, "b")], list(iter_json_array_file(
+                TestedClass, file_path, encoding="utf-16")))
+        
+        print("Testing invalid modes...")
+        self.assertRaises(ValueError, lambda: open_compressed("data.json", "r"))
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# Imports
+from dataclasses import dataclass, field
+from typing import Optional
+import unittest
+
+from mooss.serialize.interface import ISerializable
+
+
+# Classes
+@dataclass
+class TestedNestedClass(ISerializable):
+    field_int: int = 0
+
+
+@dataclass
+class TestedDefaultsClass(ISerializable):
+    field_str: str
+    field_int: int = 42
+    field_optional: Optional[str] = None
+    field_list: list = field(default_factory=list)
+    field_dict_int: dict[str, int] = field(default_factory=lambda: {"a": 1})
+    field_nested: TestedNestedClass = field(default_factory=TestedNestedClass)
+
+
+# Unit tests
+class TestDefaults(unittest.TestCase):
+    def test_defaults(self):
+        """
+        Testing if missing fields are filled with their default values and factories.
+        """
+        
+        print("Testing constant defaults and factories...")
+        parsed_class = TestedDefaultsClass.from_dict({"field_str": "abc"})
+        self.assertEqual(TestedDefaultsClass("abc", 42, None, [], {"a": 1}, TestedNestedClass(0)), parsed_class)
+        
+        print("Testing if factories are called for every class...")
+        other_parsed_class = TestedDefaultsClass.from_json('{"field_str": "def"}')
+        self.assertIsNot(parsed_class.field_list, other_parsed_class.field_list)
+        self.assertIsNot(parsed_class.field_dict_int, other_parsed_class.field_dict_int)
+        self.assertIsNot(parsed_class.field_nested, other_parsed_class.field_nested)
+        
+        print("Testing if given values are used instead of the defaults...")
+        self.assertEqual([1, 2], TestedDefaultsClass.from_dict({"field_str": "abc", "field_list": [1, 2]}).field_list)
+        
+        print("Testing if missing fields without defaults are refused...")
+        self.assertRaises(ValueError, lambda: TestedDefaultsClass.from_dict({"field_int": 1}))
+    
+    def test_fillers_table(self):
+        """
+        Testing if the table of default values is properly computed.
+        """
+        
+        print("Testing the table's content...")
+        field_fillers = TestedDefaultsClass._get_field_fillers()
+        self.assertNotIn("field_str", field_fillers)
+        self.assertEqual((42, None), field_fillers["field_int"])
+        self.assertEqual((None, list), field_fillers["field_list"])
+        self.assertIs(field_fillers, TestedDefaultsClass._get_field_fillers())
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# Imports
+from dataclasses import dataclass, field
+from typing import Optional
+import unittest
+
+from mooss.serialize.interface import ISerializable
+from mooss.serialize.options import DeserializeOptions, EListValidation, STRICT, TRUSTED
+
+
+# Classes
+@dataclass
+class TestedNestedClass(ISerializable):
+    field_int: int
+
+
+@dataclass
+class TestedListClass(ISerializable):
+    field_list_int: list[int]
+    field_list_nested: Optional[list[TestedNestedClass]] = None
+
+
+@dataclass
+class TestedMetadataClass(ISerializable):
+    field_list_int: list[int] = field(metadata={"list_validation": EListValidation.LIST_VALIDATION_FULL})
+
+
+# Unit tests
+class TestListValidation(unittest.TestCase):
+    def test_policies(self):
+        """
+        Testing if the elements of lists are validated according to the chosen policy.
+        """
+        
+        data_invalid_last = {"field_list_int": [1, 2, 3, 4, "5"]}
+        data_invalid_first = {"field_list_int": ["1", 2, 3, 4, 5]}
+        
+        print("Testing the default policy...")
+        self.assertRaises(TypeError, lambda: TestedListClass.from_dict(data_invalid_first))
+        self.assertEqual([1, 2, 3, 4, "5"], TestedListClass.from_dict(data_invalid_last).field_list_int)
+        
+        print("Testing the full policy...")
+        self.assertRaises(TypeError, lambda: TestedListClass.from_dict(data_invalid_last, options=STRICT))
+        
+        print("Testing the first-N policy...")
+        options = DeserializeOptions(list_validation=EListValidation.LIST_VALIDATION_FIRST, list_validation_count=4)
+        self.assertEqual([1, 2, 3, 4, "5"],
+                         TestedListClass.from_dict(data_invalid_last, options=options).field_list_int)
+        self.assertRaises(TypeError, lambda: TestedListClass.from_dict(
+            data_invalid_last, options=options.replace(list_validation_count=5)))
+        
+        print("Testing the sampling policy...")
+        options = DeserializeOptions(list_validation=EListValidation.LIST_VALIDATION_SAMPLE, list_validation_count=2)
+        for _ in range(20):
+            TestedListClass.from_dict({"field_list_int": list(range(100))}, options=options)
+        self.assertRaises(TypeError, lambda: TestedListClass.from_dict(
+            data_invalid_last, options=options.replace(list_validation_count=10)))
+        
+        print("Testing the disabled policies...")
+        self.assertEqual(["1", 2, 3, 4, 5],
+                         TestedListClass.from_dict(data_invalid_first, options=TRUSTED).field_list_int)
+        self.assertEqual(["1", 2, 3, 4, 5], TestedListClass.from_dict(data_invalid_first, options=DeserializeOptions(
+            list_validation=EListValidation.LIST_VALIDATION_OFF)).field_list_int)
+    
+    def test_field_metadata(self):
+        """
+        Testing if the policy given in a field's metadata overrides the one of the options.
+        """
+        
+        print("Testing the field's policy...")
+        self.assertRaises(TypeError, lambda: TestedMetadataClass.from_dict({"field_list_int": [1, 2, "3"]}))
+        self.assertEqual([1, 2, 3], TestedMetadataClass.from_dict({"field_list_int": [1, 2, 3]}).field_list_int)
+        
+        print("Testing if 'validate_type' still disables it...")
+        self.assertEqual([1, 2, "3"], TestedMetadataClass.from_dict({"field_list_int": [1, 2, "3"]},
+                                                                    validate_type=False).field_list_int)
+    
+    def test_listed_classes(self):
+        """
+        Testing if every element of a list of 'ISerializable' classes is deserialized.
+        """
+        
+        print("Testing a list of nested classes...")
+        parsed_class = TestedListClass.from_dict({
+            "field_list_int": [],
+            "field_list_nested": [{"field_int": 1}, {"field_int": 2}],
+        })
+        self.assertEqual([TestedNestedClass(1), TestedNestedClass(2)], parsed_class.field_list_nested)
+        
+        print("Testing the parsing depth...")
+        parsed_class = TestedListClass.from_dict({
+            "field_list_int": [],
+            "field_list_nested": [{"field_int": 1}],
+        }, parsing_depth=1)
+        self.assertEqual([{"field_int": 1}], parsed_class.field_list_nested)
+        
+        print("Testing invalid nested classes...")
+        self.assertRaises(TypeError, lambda: TestedListClass.from_dict({
+            "field_list_int": [],
+            "field_list_nested": [{"field_int": 1}, {"field_int": "2"}],
+        }))
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# Imports
+from dataclasses import dataclass
+import json
+import os
+import tempfile
+import unittest
+
+from mooss.serialize.interface import ISerializable
+from mooss.serialize.loader import load_json_files
+
+
+# Classes
+@dataclass
+class TestedClass(ISerializable):
+    field_int: int
+    field_str: str
+
+
+# Unit tests
+class TestLoader(unittest.TestCase):
+    def test_load_json_files(self):
+        """
+        Testing if many files are properly loaded and if errors are reported per file.
+        """
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            print("> Preparing files...")
+            os.makedirs(os.path.join(temp_dir, "nested"))
+            valid_paths = list()
+            for i in range(20):
+                valid_paths.append(os.path.join(temp_dir, "nested" if i % 2 else "", "valid_{}.json".format(i)))
+                with open(valid_paths[-1], "w", encoding="utf-8") as file:
+                    json.dump({"field_int": i, "field_str": str(i)}, file)
+            
+            invalid_type_path = os.path.join(temp_dir, "invalid_type.json")
+            with open(invalid_type_path, "w", encoding="utf-8") as file:
+                json.dump({"field_int": "abc", "field_str": "abc"}, file)
+            
+            invalid_json_path = os.path.join(temp_dir, "invalid_json.json")
+            with open(invalid_json_path, "w", encoding="utf-8") as file:
+                file.write("{")
+            
+            missing_path = os.path.join(temp_dir, "missing.json")
+            
+            print("Testing with a list of paths...")
+            load_result = load_json_files(TestedClass, valid_paths + [invalid_type_path, missing_path], max_workers=4)
+            self.assertEqual(valid_paths, list(load_result.instances.keys()))
+            for i, valid_path in enumerate(valid_paths):
+                self.assertEqual(TestedClass(i, str(i)), load_result.instances[valid_path])
+            self.assertTrue(load_result.has_errors())
+            self.assertIsInstance(load_result.errors[invalid_type_path], TypeError)
+            self.assertIsInstance(load_result.errors[missing_path], FileNotFoundError)
+            
+            print("Testing with a glob pattern...")
+            load_result = load_json_files(TestedClass, os.path.join(temp_dir, "**", "*.json"))
+            self.assertEqual(set(valid_paths), set(load_result.instances.keys()))
+            self.assertEqual({invalid_type_path, invalid_json_path}, set(load_result.errors.keys()))
+            
+            print("Testing if 'from_json' parameters are used...")
+            load_result = load_json_files(TestedClass, [invalid_type_path], validate_type=False)
+            self.assertFalse(load_result.has_errors())
+            self.assertEqual("abc", load_result.instances[invalid_type_path].field_int)
+        
+        print("Testing invalid parameters...")
+        self.assertRaises(TypeError, lambda: load_json_files(dict, []))
+        self.assertRaises(ValueError, lambda: load_json_files(TestedClass, [], max_workers=0))
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+# Imports
+from dataclasses import dataclass
+import gc
+import os
+import platform
+import tracemalloc
+from typing import Any, Callable, Optional
+import unittest
+
+from mooss.serialize.interface import ISerializable
+from mooss.serialize.options import DeserializeOptions
+
+
+# Constants
+RECORD_COUNT = 500
+"""
+Amount of records deserialized for each measurement, the results are given per record.
+"""
+
+MEMORY_BUDGETS: dict[str, tuple[int, int, int]] = {
+    "primitive": (720, 240, 4),
+    "nested": (1450, 440, 8),
+    "list_heavy": (4850, 3450, 47),
+    "list_heavy_deep_copy": (7400, 3860, 49),
+    "unknown_heavy": (1750, 410, 5),
+}
+"""
+Default budgets of each model, in peak bytes, retained bytes and retained memory blocks per record.
+They are set to about 1.25 times the highest values measured on CPython 3.9 to 3.11, rounded up.
+They can be overridden with the 'MOOSS_MEMORY_BUDGET_<MODEL>' environment variables set to 3 comma-separated
+integers, or all scaled at once with the 'MOOSS_MEMORY_BUDGET_SCALE' environment variable.
+"""
+
+
+# Classes
+@dataclass
+class TestedPrimitiveClass(ISerializable):
+    field_int: int
+    field_float: float
+    field_str: str
+    field_bool: bool
+
+
+@dataclass
+class TestedNestedClass(ISerializable):
+    field_int: int
+    field_nested: Optional[TestedPrimitiveClass]
+
+
+@dataclass
+class TestedListClass(ISerializable):
+    field_list_int: list[int]
+    field_list_nested: list[TestedPrimitiveClass]
+
+
+@dataclass
+class TestedUnknownClass(ISerializable):
+    field_int: int
+
+
+# Functions
+def get_memory_budget(model_name: str) -> tuple[float, float, float]:
+    """
+    Gets the memory budgets of a given model while taking the environment variables into account.
+    
+    :param model_name: The name of the model in 'MEMORY_BUDGETS'.
+    :return: A tuple containing the peak bytes, retained bytes and retained memory blocks allowed per record.
+    """
+    
+    budget = MEMORY_BUDGETS[model_name]
+    
+    budget_override = os.environ.get("MOOSS_MEMORY_BUDGET_{}".format(model_name.upper()))
+    if budget_override is not None:
+        budget = tuple(int(budget_value) for budget_value in budget_override.split(","))
+    
+    budget_scale = float(os.environ.get("MOOSS_MEMORY_BUDGET_SCALE", "1"))
+    
+    return budget[0] * budget_scale, budget[1] * budget_scale, budget[2] * budget_scale
+
+
+def measure_memory(deserializer: Callable[[dict], Any], data_dicts: list[dict]) -> tuple[float, float, float]:
+    """
+    Measures the memory allocated while deserializing the given records with 'tracemalloc'.
+    
+    The deserializer is called once before the measurement to fill the caches used by 'from_dict'.
+    The peak is measured around each call while discarding its result so that it only includes the allocations of a
+    single record, the retained memory is then measured in a separate pass that keeps every result.
+    
+    :param deserializer: The function that deserializes a single record.
+    :param data_dicts: The records to deserialize.
+    :return: A tuple containing the peak bytes, retained bytes and retained memory blocks per record.
+    """
+    
+    deserializer(data_dicts[0])
+    gc.collect()
+    
+    tracemalloc.start()
+    
+    try:
+        total_peak_size = 0
+        
+        for data_dict in data_dicts:
+            start_size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            
+            deserializer(data_dict)
+            
+            total_peak_size += tracemalloc.get_traced_memory()[1] - start_size
+        
+        gc.collect()
+        start_snapshot = tracemalloc.take_snapshot()
+        start_size = tracemalloc.get_traced_memory()[0]
+        
+        instances = [deserializer(data_dict) for data_dict in data_dicts]
+        
+        end_size = tracemalloc.get_traced_memory()[0]
+        end_snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    
+    # Only counting the blocks allocated by the tested code, not the ones of 'tracemalloc' itself.
+    retained_blocks = sum(
+        statistic.count_diff for statistic in end_snapshot.compare_to(start_snapshot, "filename")
+        if not statistic.traceback[0].filename.endswith("tracemalloc.py")
+    )
+    
+    del instances
+    
+    return (total_peak_size / len(data_dicts), (end_size - start_size) / len(data_dicts),
+            retained_blocks / len(data_dicts))
+
+
+# Unit tests
+@unittest.skipUnless(platform.python_implementation() == "CPython",
+                     "The budgets are calibrated for CPython and 'tracemalloc' doesn't work on other interpreters !")
+class TestMemory(unittest.TestCase):
+    def assert_memory_budget(self, model_name: str, deserializer: Callable[[dict], Any], data_dicts: list[dict]):
+        peak_size, retained_size, retained_blocks = measure_memory(deserializer, data_dicts)
+        peak_budget, retained_budget, blocks_budget = get_memory_budget(model_name)
+        
+        print("Testing the '{}' model: {:.0f}/{:.0f} peak bytes, {:.0f}/{:.0f} retained bytes and {:.1f}/{:.0f} "
+              "retained blocks per record...".format(model_name, peak_size, peak_budget, retained_size,
+                                                     retained_budget, retained_blocks, blocks_budget))
+        
+        self.assertLessEqual(peak_size, peak_budget)
+        self.assertLessEqual(retained_size, retained_budget)
+        self.assertLessEqual(retained_blocks, blocks_budget)
+    
+    def test_primitive_model(self):
+        """
+        Testing the memory used by classes that only contain primitives.
+        """
+        
+        self.assert_memory_budget("primitive", TestedPrimitiveClass.from_dict, [
+            {"field_int": i, "field_float": i / 3, "field_str": "abc", "field_bool": i % 2 == 0}
+            for i in range(RECORD_COUNT)
+        ])
+    
+    def test_nested_model(self):
+        """
+        Testing the memory used by classes that contain a nested class.
+        """
+        
+        self.assert_memory_budget("nested", TestedNestedClass.from_dict, [
+            {"field_int": i, "field_nested": {"field_int": i, "field_float": 0.5, "field_str": "a", "field_bool": True}}
+            for i in range(RECORD_COUNT)
+        ])
+    
+    def test_list_heavy_model(self):
+        """
+        Testing the memory used by classes that contain long lists, with and without deep copies.
+        """
+        
+        data_dicts = [{
+            "field_list_int": list(range(i, i + 100)),
+            "field_list_nested": [
+                {"field_int": j, "field_float": 0.5, "field_str": "a", "field_bool": True} for j in range(10)
+            ],
+        } for i in range(RECORD_COUNT)]
+        
+        self.assert_memory_budget("list_heavy", TestedListClass.from_dict, data_dicts)
+        self.assert_memory_budget("list_heavy_deep_copy", lambda data_dict: TestedListClass.from_dict(
+            data_dict, options=DeserializeOptions(do_deep_copy=True)), data_dicts)
+    
+    def test_unknown_heavy_model(self):
+        """
+        Testing the memory used by classes that receive many unknown fields added as-is.
+        """
+        
+        options = DeserializeOptions(allow_unknown=True, add_unknown_as_is=True)
+        
+        self.assert_memory_budget("unknown_heavy", lambda data_dict: TestedUnknownClass.from_dict(
+            data_dict, options=options), [
+            {"field_int": i, **{"unknown_{}".format(j): j for j in range(20)}} for i in range(RECORD_COUNT)
+        ])
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# Imports
+from dataclasses import dataclass, FrozenInstanceError
+import json
+import unittest
+
+from mooss.serialize.interface import ISerializable
+from mooss.serialize.options import DeserializeOptions, resolve_options, DEFAULT, STRICT, LENIENT, TRUSTED
+
+
+# Classes
+@dataclass
+class TestedNestedClass(ISerializable):
+    field_int: int
+
+
+@dataclass
+class TestedRootClass(ISerializable):
+    field_nested: TestedNestedClass
+
+
+# Unit tests
+class TestOptions(unittest.TestCase):
+    def test_options_object(self):
+        """
+        Testing if options objects are immutable, hashable and properly merged with individual options.
+        """
+        
+        print("Testing immutability and hashing...")
+        self.assertRaises(FrozenInstanceError, lambda: setattr(DEFAULT, "allow_unknown", True))
+        self.assertEqual(hash(DeserializeOptions()), hash(DEFAULT))
+        self.assertEqual(hash(DEFAULT), hash(DEFAULT))
+        self.assertNotEqual(hash(DEFAULT), hash(DEFAULT.replace(allow_unknown=True)))
+        self.assertEqual(DEFAULT, DeserializeOptions())
+        self.assertEqual(4, len({DEFAULT, STRICT, LENIENT, TRUSTED}))
+        
+        print("Testing the merging of individual options...")
+        self.assertIs(TRUSTED, resolve_options(TRUSTED, allow_unknown=None, validate_type=None))
+        self.assertIs(DEFAULT, resolve_options(None))
+        self.assertEqual(TRUSTED.replace(validate_type=True), resolve_options(TRUSTED, validate_type=True))
+    
+    def test_deserialization(self):
+        """
+        Testing if options objects are used by every entry point and passed down to nested classes.
+        """
+        
+        data_unknown = {"field_nested": {"field_int": 1, "unknown": 2}}
+        data_invalid = {"field_nested": {"field_int": "abc"}}
+        
+        print("Testing the presets...")
+        self.assertRaises(ValueError, lambda: TestedRootClass.from_dict(data_unknown, options=STRICT))
+        self.assertEqual(TestedRootClass(TestedNestedClass(1)),
+                         TestedRootClass.from_dict(data_unknown, options=LENIENT))
+        self.assertRaises(TypeError, lambda: TestedRootClass.from_dict(data_invalid, options=LENIENT))
+        self.assertEqual("abc", TestedRootClass.from_dict(data_invalid, options=TRUSTED).field_nested.field_int)
+        self.assertEqual(
+            TestedRootClass(TestedNestedClass(1)),
+            TestedRootClass.from_json(json.dumps(data_unknown), options=LENIENT)
+        )
+        
+        print("Testing if individual options override the given object...")
+        self.assertRaises(ValueError, lambda: TestedRootClass.from_dict(data_unknown, options=LENIENT,
+                                                                        allow_unknown=False))
+        self.assertRaises(TypeError, lambda: TestedRootClass.from_json(json.dumps(data_invalid), options=TRUSTED,
+                                                                       validate_type=True))
+        
+        print("Testing the parsing depth...")
+        self.assertEqual(
+            {"field_int": 1},
+            TestedRootClass.from_dict({"field_nested": {"field_int": 1}}, options=TRUSTED.replace(parsing_depth=1))
+            .field_nested
+        )
+        
+        print("Testing 'update_from_dict'...")
+        tested_class = TestedRootClass(TestedNestedClass(1))
+        tested_class.update_from_dict(data_unknown, options=LENIENT)
+        self.assertEqual(TestedRootClass(TestedNestedClass(1)), tested_class)
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+# Imports
+from dataclasses import dataclass
+from typing import Optional
+import unittest
+
+from mooss.serialize.interface import ISerializable
+
+
+# Classes
+@dataclass
+class TestedEventClass(ISerializable, discriminator="type"):
+    timestamp: int
+
+
+@dataclass
+class TestedClickEventClass(TestedEventClass, tag="click"):
+    position_x: int
+    position_y: int
+
+
+@dataclass
+class TestedKeyEventClass(TestedEventClass, tag="key"):
+    key_code: int
+
+
+@dataclass
+class TestedShortcutEventClass(TestedKeyEventClass, tag="shortcut"):
+    modifiers: list[str]
+
+
+@dataclass
+class TestedOtherClass(ISerializable, discriminator="kind"):
+    field_int: int
+
+
+@dataclass
+class TestedBusClass(ISerializable):
+    last_event: Optional[TestedEventClass]
+    events: list[TestedEventClass]
+
+
+# Unit tests
+class TestPolymorphism(unittest.TestCase):
+    def test_registration(self):
+        """
+        Testing if the tagged classes are registered in the hierarchy of their base class.
+        """
+        
+        print("Testing the registry...")
+        self.assertIs(TestedEventClass._discriminator_registry, TestedShortcutEventClass._discriminator_registry)
+        self.assertEqual({"click": TestedClickEventClass, "key": TestedKeyEventClass,
+                          "shortcut": TestedShortcutEventClass}, TestedEventClass._discriminator_registry)
+        self.assertEqual({}, TestedOtherClass._discriminator_registry)
+        self.assertIsNone(TestedEventClass._discriminator_tag)
+        
+        print("Testing invalid tags...")
+        
+        def declare_duplicated_tag():
+            @dataclass
+            class TestedDuplicatedClass(TestedEventClass, tag="click"):
+                pass
+        
+        def declare_orphan_tag():
+            @dataclass
+            class TestedOrphanClass(ISerializable, tag="orphan"):
+                pass
+        
+        self.assertRaises(ValueError, declare_duplicated_tag)
+        self.assertRaises(TypeError, declare_orphan_tag)
+    
+    def test_deserialization(self):
+        """
+        Testing if the concrete class is picked through the tag for the root, fields and lists.
+        """
+        
+        print("Testing the root class...")
+        self.assertEqual(TestedClickEventClass(1, 2, 3), TestedEventClass.from_dict(
+            {"type": "click", "timestamp": 1, "position_x": 2, "position_y": 3}))
+        self.assertEqual(TestedShortcutEventClass(1, 2, ["ctrl"]), TestedKeyEventClass.from_json(
+            '{"type": "shortcut", "timestamp": 1, "key_code": 2, "modifiers": ["ctrl"]}'))
+        self.assertEqual(TestedKeyEventClass(1, 2), TestedKeyEventClass.from_dict({"timestamp": 1, "key_code": 2}))
+        
+        print("Testing fields and lists...")
+        parsed_bus = TestedBusClass.from_dict({
+            "last_event": {"type": "key", "timestamp": 3, "key_code": 4},
+            "events": [
+                {"type": "click", "timestamp": 1, "position_x": 2, "position_y": 3},
+                {"type": "key", "timestamp": 3, "key_code": 4},
+            ],
+        })
+        self.assertEqual(TestedBusClass(TestedKeyEventClass(3, 4), [
+            TestedClickEventClass(1, 2, 3), TestedKeyEventClass(3, 4),
+        ]), parsed_bus)
+        
+        print("Testing invalid tags...")
+        self.assertRaises(ValueError, lambda: TestedEventClass.from_dict({"type": "scroll", "timestamp": 1}))
+        self.assertRaises(TypeError, lambda: TestedKeyEventClass.from_dict(
+            {"type": "click", "timestamp": 1, "position_x": 2, "position_y": 3}))
+    
+    def test_serialization(self):
+        """
+        Testing if the tag is serialized and allows the classes to be deserialized back.
+        """
+        
+        bus = TestedBusClass(TestedShortcutEventClass(1, 2, ["ctrl"]), [TestedClickEventClass(1, 2, 3)])
+        
+        print("Testing the serialized tags...")
+        bus_dict = bus.to_dict()
+        self.assertEqual({"type": "shortcut", "timestamp": 1, "key_code": 2, "modifiers": ["ctrl"]},
+                         bus_dict["last_event"])
+        self.assertEqual("click", bus_dict["events"][0]["type"])
+        self.assertEqual({"field_int": 1}, TestedOtherClass(1).to_dict())
+        
+        print("Testing a round trip...")
+        self.assertEqual(bus, TestedBusClass.from_json(bus.to_json()))
+        
+        print("Testing updates with tags...")
+        bus.update_from_dict({"last_event": {"type": "shortcut", "key_code": 5}})
+        self.assertEqual(TestedShortcutEventClass(1, 5, ["ctrl"]), bus.last_event)
+        bus.update_from_dict({"last_event": {"type": "key", "timestamp": 2, "key_code": 6}})
+        self.assertEqual(TestedKeyEventClass(2, 6), bus.last_event)
+    
+    def test_binary_format(self):
+        """
+        Testing if the concrete classes of polymorphic fields are kept in the binary format.
+        """
+        
+        bus = TestedBusClass(TestedShortcutEventClass(1, 2, ["ctrl"]), [
+            TestedClickEventClass(1, 2, 3), TestedEventClass(4), TestedKeyEventClass(5, 6),
+        ])
+        
+        print("Testing a binary round trip...")
+        decoded_bus = TestedBusClass.from_bytes(bus.to_bytes())
+        self.assertEqual(bus, decoded_bus)
+        self.assertEqual([TestedClickEventClass, TestedEventClass, TestedKeyEventClass],
+                         [type(event) for event in decoded_bus.events])
+        self.assertEqual(TestedClickEventClass(1, 2, 3),
+                         TestedClickEventClass.from_bytes(TestedClickEventClass(1, 2, 3).to_bytes()))
+        
+        print("Testing polymorphic roots...")
+        click_event = TestedClickEventClass(1, 2, 3)
+        self.assertEqual(click_event, TestedEventClass.from_bytes(click_event.to_bytes()))
+        self.assertEqual(TestedEventClass.from_json(click_event.to_json()),
+                         TestedEventClass.from_bytes(click_event.to_bytes()))
+        self.assertEqual(TestedShortcutEventClass(1, 2, ["ctrl"]), TestedKeyEventClass.from_bytes(
+            TestedShortcutEventClass(1, 2, ["ctrl"]).to_bytes()))
+        self.assertEqual(TestedEventClass(4), TestedEventClass.from_bytes(TestedEventClass(4).to_bytes()))
+        self.assertRaises(TypeError, lambda: TestedKeyEventClass.from_bytes(click_event.to_bytes()))
+        
+        print("Testing untagged subclasses...")
+        
+        @dataclass
+        class TestedUntaggedEventClass(TestedEventClass):
+            field_lost: int
+        
+        bus.last_event = TestedUntaggedEventClass(1, 2)
+        self.assertRaises(TypeError, lambda: bus.to_bytes())
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
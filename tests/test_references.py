@@ -0,0 +1,130 @@
+# Imports
+from dataclasses import dataclass, field
+import json
+from typing import Optional
+import unittest
+
+from mooss.serialize.interface import ISerializable
+from mooss.serialize.options import DeserializeOptions
+
+
+# Classes
+@dataclass
+class TestedVendorClass(ISerializable):
+    name: str
+
+
+@dataclass
+class TestedProductClass(ISerializable):
+    name: str
+    vendor: TestedVendorClass
+    previous_vendor: Optional[TestedVendorClass] = None
+
+
+@dataclass
+class TestedCatalogClass(ISerializable):
+    first_product: TestedProductClass
+    second_product: TestedProductClass
+
+
+@dataclass
+class TestedNodeClass(ISerializable):
+    name: str
+    parent: Optional["TestedNodeClass"] = None
+    children: list["TestedNodeClass"] = field(default_factory=list)
+
+
+# Unit tests
+class TestReferences(unittest.TestCase):
+    def test_shared_instances(self):
+        """
+        Testing if shared instances are serialized once and restored as a single instance.
+        """
+        
+        vendor = TestedVendorClass("ACME")
+        catalog = TestedCatalogClass(
+            first_product=TestedProductClass("Anvil", vendor),
+            second_product=TestedProductClass("Rocket", vendor, vendor),
+        )
+        
+        print("Testing the default serialization...")
+        self.assertEqual({"name": "ACME"}, catalog.to_dict()["second_product"]["previous_vendor"])
+        
+        print("Testing the serialization with references...")
+        catalog_dict = catalog.to_dict(track_references=True)
+        self.assertEqual({
+            "first_product": {"name": "Anvil", "vendor": {"$id": 0, "name": "ACME"}, "previous_vendor": None},
+            "second_product": {"name": "Rocket", "vendor": {"$ref": 0}, "previous_vendor": {"$ref": 0}},
+        }, catalog_dict)
+        
+        print("Testing the deserialization with references...")
+        parsed_catalog = TestedCatalogClass.from_dict(catalog_dict, options=DeserializeOptions(resolve_references=True))
+        self.assertEqual(catalog, parsed_catalog)
+        self.assertIs(parsed_catalog.first_product.vendor, parsed_catalog.second_product.vendor)
+        self.assertIs(parsed_catalog.first_product.vendor, parsed_catalog.second_product.previous_vendor)
+        
+        parsed_catalog = TestedCatalogClass.from_json(catalog.to_json(track_references=True),
+                                                      options=DeserializeOptions(resolve_references=True))
+        self.assertIs(parsed_catalog.first_product.vendor, parsed_catalog.second_product.vendor)
+        
+        print("Testing if markers are refused without 'resolve_references'...")
+        self.assertRaises(ValueError, lambda: TestedCatalogClass.from_dict(catalog_dict))
+    
+    def test_cycles(self):
+        """
+        Testing if cycles are properly serialized and restored.
+        """
+        
+        root_node = TestedNodeClass("root")
+        root_node.parent = root_node
+        
+        print("Testing the serialization of a cycle...")
+        node_dict = root_node.to_dict(track_references=True)
+        self.assertEqual({"$id": 0, "name": "root", "parent": {"$ref": 0}, "children": []}, node_dict)
+        json.dumps(node_dict)
+        
+        print("Testing the deserialization of a cycle...")
+        parsed_node = TestedNodeClass.from_dict(node_dict, options=DeserializeOptions(resolve_references=True))
+        self.assertIs(parsed_node, parsed_node.parent)
+        self.assertEqual("root", parsed_node.name)
+        
+        print("Testing a longer cycle...")
+        child_node = TestedNodeClass("child", TestedNodeClass("middle", root_node))
+        root_node.parent = child_node
+        parsed_node = TestedNodeClass.from_json(child_node.to_json(track_references=True),
+                                                options=DeserializeOptions(resolve_references=True))
+        self.assertEqual(["child", "middle", "root"], [parsed_node.name, parsed_node.parent.name,
+                                                       parsed_node.parent.parent.name])
+        self.assertIs(parsed_node, parsed_node.parent.parent.parent)
+        
+        print("Testing forward references in lists...")
+        root_node = TestedNodeClass("root")
+        root_node.children = [TestedNodeClass("child", root_node), TestedNodeClass("other", root_node)]
+        parsed_node = TestedNodeClass.from_dict(root_node.to_dict(track_references=True),
+                                                options=DeserializeOptions(resolve_references=True))
+        self.assertEqual(["child", "other"], [child_node.name for child_node in parsed_node.children])
+        self.assertIs(parsed_node, parsed_node.children[1].parent)
+    
+    def test_invalid_references(self):
+        """
+        Testing if invalid references are properly rejected.
+        """
+        
+        options = DeserializeOptions(resolve_references=True)
+        
+        print("Testing unknown and duplicated reference ids...")
+        self.assertRaises(ValueError, lambda: TestedProductClass.from_dict(
+            {"name": "Anvil", "vendor": {"$ref": 0}}, options=options))
+        self.assertRaises(ValueError, lambda: TestedCatalogClass.from_dict({
+            "first_product": {"$id": 0, "name": "Anvil", "vendor": {"name": "ACME"}},
+            "second_product": {"$id": 0, "name": "Rocket", "vendor": {"name": "ACME"}},
+        }, options=options))
+        
+        print("Testing references to the wrong class...")
+        self.assertRaises(TypeError, lambda: TestedProductClass.from_dict(
+            {"$id": 0, "name": "Anvil", "vendor": {"$ref": 0}}, options=options))
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
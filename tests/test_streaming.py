@@ -0,0 +1,76 @@
+# Imports
+from dataclasses import dataclass
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from mooss.serialize.interface import ISerializable
+from mooss.serialize.options import LENIENT
+from mooss.serialize.streaming import iter_json_array
+
+
+# Classes
+@dataclass
+class TestedClass(ISerializable):
+    field_int: int
+    field_str: str
+
+
+# Unit tests
+class TestStreaming(unittest.TestCase):
+    def test_iter_json_array(self):
+        """
+        Testing if JSON arrays are properly read incrementally from different sources.
+        """
+        
+        expected_classes = [TestedClass(i * 1234567, "Hello world ! éà {}".format(i) * (i % 5)) for i in range(50)]
+        data_json = json.dumps([{"field_int": c.field_int, "field_str": c.field_str} for c in expected_classes],
+                               indent=1, ensure_ascii=False)
+        
+        print("Testing with text and binary streams and small chunks...")
+        for chunk_size in [1, 7, 4096]:
+            self.assertEqual(expected_classes, list(iter_json_array(
+                TestedClass, io.StringIO(data_json), chunk_size=chunk_size)))
+            self.assertEqual(expected_classes, list(iter_json_array(
+                TestedClass, io.BytesIO(data_json.encode("utf-8")), chunk_size=chunk_size)))
+        
+        print("Testing with a file path...")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "data.json")
+            with open(file_path, "w", encoding="utf-8") as file:
+                file.write(data_json)
+            self.assertEqual(expected_classes, list(iter_json_array(TestedClass, file_path, chunk_size=13)))
+        
+        print("Testing empty arrays and options...")
+        self.assertEqual([], list(iter_json_array(TestedClass, io.StringIO(" [ ] "))))
+        self.assertEqual([TestedClass(1, "a")], list(iter_json_array(
+            TestedClass, io.StringIO('[{"field_int": 1, "field_str": "a", "unknown": null}]'), options=LENIENT)))
+    
+    def test_invalid(self):
+        """
+        Testing if malformed arrays are properly rejected.
+        """
+        
+        print("Testing malformed arrays...")
+        for data_json in ['{"field_int": 1}', '[{"field_int": 1, "field_str": "a"} {}]',
+                          '[{"field_int": 1, "field_str": "a"}] []']:
+            self.assertRaises(ValueError, lambda: list(iter_json_array(TestedClass, io.StringIO(data_json))))
+        self.assertRaises(json.JSONDecodeError, lambda: list(iter_json_array(
+            TestedClass, io.StringIO('[{"field_int": 1, "field_str": "a"'), chunk_size=4)))
+        
+        print("Testing if malformed elements are rejected without reading the rest of the stream...")
+        stream = io.StringIO('[{"field_int" 1, "field_str": "a"}, ' + '{"field_int": 2, "field_str": "b"}, ' * 1000 +
+                             '{"field_int": 3, "field_str": "c"}]')
+        self.assertRaises(json.JSONDecodeError, lambda: list(iter_json_array(TestedClass, stream, chunk_size=64)))
+        self.assertLessEqual(stream.tell(), 64)
+        
+        print("Testing invalid elements...")
+        self.assertRaises(TypeError, lambda: list(iter_json_array(TestedClass, io.StringIO("[1]"))))
+        self.assertRaises(TypeError, lambda: list(iter_json_array(dict, io.StringIO("[]"))))
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
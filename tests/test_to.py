@@ -0,0 +1,122 @@
+# Imports
+from dataclasses import dataclass
+import json
+from typing import Optional
+import unittest
+
+from mooss.serialize.interface import ISerializable, ITrackable
+
+
+# Classes
+@dataclass
+class TestedNestedClass(ISerializable):
+    field_int: int
+    field_str: str
+
+
+@dataclass
+class TestedRootClass(ISerializable):
+    field_int: int
+    field_list: list
+    field_nested: TestedNestedClass
+    field_optional_nested: Optional[TestedNestedClass] = None
+
+
+@dataclass
+class TestedTrackedNestedClass(ITrackable):
+    field_int: int
+    field_str: str
+
+
+@dataclass
+class TestedTrackedRootClass(ITrackable):
+    field_int: int
+    field_list: list
+    field_nested: TestedTrackedNestedClass
+    field_optional_nested: Optional[TestedTrackedNestedClass] = None
+    field_untracked_nested: Optional[TestedNestedClass] = None
+
+
+# Unit tests
+class TestToMethods(unittest.TestCase):
+    def test_to_dict(self):
+        """
+        Testing if classes are properly serialized and can be deserialized back.
+        """
+        
+        print("Testing 'to_dict' and 'to_json'...")
+        data = {
+            "field_int": 42,
+            "field_list": [1, "abc", {"key": None}],
+            "field_nested": {"field_int": 120, "field_str": "abc"},
+            "field_optional_nested": None,
+        }
+        tested_class = TestedRootClass.from_dict(data)
+        self.assertEqual(data, tested_class.to_dict())
+        self.assertEqual(data, json.loads(tested_class.to_json()))
+        self.assertEqual(tested_class, TestedRootClass.from_dict(tested_class.to_dict()))
+        
+        print("Testing if the serialized data is a copy...")
+        tested_class.to_dict()["field_list"].append(2)
+        self.assertEqual(3, len(tested_class.field_list))
+    
+    def test_change_tracking(self):
+        """
+        Testing if assigned fields are tracked and if deltas only contain them.
+        """
+        
+        tested_class = TestedTrackedRootClass.from_dict({
+            "field_int": 42,
+            "field_list": [],
+            "field_nested": {"field_int": 120, "field_str": "abc"},
+        })
+        
+        print("Testing if change tracking is disabled by default...")
+        self.assertFalse(tested_class.is_tracking_changes())
+        self.assertRaises(RuntimeError, lambda: tested_class.to_delta_dict())
+        self.assertRaises(RuntimeError, lambda: tested_class.get_changed_fields())
+        
+        print("Testing the deltas...")
+        tested_class.enable_change_tracking()
+        self.assertEqual({}, tested_class.to_delta_dict())
+        tested_class.field_int = 13
+        tested_class.field_nested.field_str = "def"
+        self.assertEqual({"field_int"}, tested_class.get_changed_fields())
+        self.assertEqual({"field_int": 13, "field_nested": {"field_str": "def"}}, tested_class.to_delta_dict())
+        
+        print("Testing the snapshots...")
+        tested_class.clear_changes()
+        self.assertEqual({}, tested_class.to_delta_dict())
+        
+        print("Testing newly assigned nested classes...")
+        tested_class.field_optional_nested = TestedTrackedNestedClass(1, "a")
+        self.assertEqual({"field_optional_nested": {"field_int": 1, "field_str": "a"}}, tested_class.to_delta_dict())
+        tested_class.clear_changes()
+        tested_class.field_optional_nested.field_int = 2
+        self.assertEqual({"field_optional_nested": {"field_int": 2}}, tested_class.to_delta_dict())
+        
+        print("Testing if deltas can be applied onto other copies...")
+        other_class = TestedTrackedRootClass.from_dict({
+            "field_int": 13,
+            "field_list": [],
+            "field_nested": {"field_int": 120, "field_str": "def"},
+            "field_optional_nested": {"field_int": 1, "field_str": "a"},
+        })
+        other_class.update_from_dict(tested_class.to_delta_dict())
+        self.assertEqual(tested_class, other_class)
+        
+        print("Testing if plain nested classes aren't tracked...")
+        tested_class.field_untracked_nested = TestedNestedClass(3, "b")
+        tested_class.clear_changes()
+        tested_class.field_untracked_nested.field_int = 4
+        self.assertEqual({}, tested_class.to_delta_dict())
+        self.assertNotIn("__setattr__", vars(ISerializable))
+        
+        print("Testing the disabling of change tracking...")
+        tested_class.disable_change_tracking()
+        self.assertFalse(tested_class.field_nested.is_tracking_changes())
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# Imports
+from dataclasses import dataclass
+import unittest
+
+from mooss.serialize.interface import ISerializable
+
+
+# Classes
+@dataclass
+class TestedNestedClass(ISerializable):
+    field_int: int
+    field_str: str
+
+
+@dataclass
+class TestedRootClass(ISerializable):
+    field_int: int
+    field_nested: TestedNestedClass
+
+
+@dataclass(frozen=True)
+class TestedFrozenClass(ISerializable):
+    field_int: int
+    field_nested: TestedNestedClass
+
+
+@dataclass
+class TestedFrozenParentClass(ISerializable):
+    field_int: int
+    field_frozen: TestedFrozenClass
+
+
+# Unit tests
+class TestUpdateMethods(unittest.TestCase):
+    def test_update_from_dict(self):
+        """
+        Testing if patches are properly applied in-place and if nested classes are kept.
+        """
+        
+        print("Testing a valid patch...")
+        tested_class = TestedRootClass.from_dict({
+            "field_int": 1,
+            "field_nested": {"field_int": 2, "field_str": "abc"},
+        })
+        nested_class = tested_class.field_nested
+        tested_class.update_from_dict({"field_int": 42, "field_nested": {"field_str": "def"}})
+        self.assertEqual(TestedRootClass(42, TestedNestedClass(2, "def")), tested_class)
+        self.assertIs(nested_class, tested_class.field_nested)
+        
+        print("Testing if invalid patches leave the class untouched...")
+        self.assertRaises(TypeError, lambda: tested_class.update_from_dict({
+            "field_int": 13, "field_nested": {"field_str": 123}
+        }))
+        self.assertRaises(ValueError, lambda: tested_class.update_from_dict({
+            "field_int": 13, "field_nested": {"unknown": 123}
+        }))
+        self.assertEqual(TestedRootClass(42, TestedNestedClass(2, "def")), tested_class)
+        
+        print("Testing parameters related to unknown fields...")
+        tested_class.update_from_dict({"unknown": 1}, allow_unknown=True)
+        self.assertFalse(hasattr(tested_class, "unknown"))
+        tested_class.update_from_dict({"field_nested": {"unknown": 1}}, allow_unknown=True, add_unknown_as_is=True)
+        self.assertEqual(1, getattr(tested_class.field_nested, "unknown"))
+        self.assertRaises(ValueError, lambda: tested_class.update_from_dict(
+            {"__repr__": "abc"}, allow_unknown=True, add_unknown_as_is=True))
+        
+        print("Testing the parsing depth...")
+        tested_class.update_from_dict({"field_nested": {"field_int": 3, "field_str": "ghi"}}, parsing_depth=1,
+                                      validate_type=False)
+        self.assertEqual({"field_int": 3, "field_str": "ghi"}, tested_class.field_nested)
+    
+    def test_frozen_update(self):
+        """
+        Testing if nested frozen classes are replaced by an updated copy and if frozen classes are refused.
+        """
+        
+        tested_class = TestedFrozenParentClass.from_dict({
+            "field_int": 1,
+            "field_frozen": {"field_int": 2, "field_nested": {"field_int": 3, "field_str": "abc"}},
+        })
+        frozen_class = tested_class.field_frozen
+        nested_class = frozen_class.field_nested
+        
+        print("Testing nested frozen classes...")
+        tested_class.update_from_dict({"field_int": 4, "field_frozen": {"field_int": 5, "field_nested": {
+            "field_str": "def"}}})
+        self.assertEqual(TestedFrozenParentClass(4, TestedFrozenClass(5, TestedNestedClass(3, "def"))), tested_class)
+        self.assertEqual(2, frozen_class.field_int)
+        self.assertIs(nested_class, tested_class.field_frozen.field_nested)
+        
+        print("Testing frozen classes...")
+        self.assertRaises(TypeError, lambda: frozen_class.update_from_dict({"field_int": 6}))
+        self.assertEqual(2, frozen_class.field_int)
+
+
+# Main
+if __name__ == '__main__':
+    unittest.main()